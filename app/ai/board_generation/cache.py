@@ -0,0 +1,110 @@
+"""
+Disk cache for generated category questions, shared across games.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import orjson
+
+from app.ai.utils.prompt_manager import PromptManager
+
+logger = logging.getLogger(__name__)
+
+
+def template_version(prompt_manager: PromptManager, *template_names: str) -> str:
+    """
+    Hash the source of the given templates so cached output is dropped when a prompt changes.
+
+    Args:
+        prompt_manager: The prompt manager the templates are loaded from
+        *template_names: Names of the template files (with .j2 extension)
+
+    Returns:
+        Short hex digest of the template sources
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    env = prompt_manager.env
+    for template_name in template_names:
+        source, _, _ = env.loader.get_source(env, template_name)
+        digest.update(source.encode())
+    return digest.hexdigest()
+
+
+class CategoryQuestionCache:
+    """
+    Stores generated questions per (category, user input) as orjson files.
+
+    Entries older than the TTL are treated as missing, and the key includes a prompt
+    version so edits to the question templates invalidate everything cached before them.
+    """
+
+    def __init__(self, cache_dir: Path, ttl: float, version: str):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory the cache files are written to
+            ttl: Seconds an entry stays valid
+            version: Prompt version mixed into every key (see template_version)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.version = version
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _path(self, category: str, user_input: str) -> Path:
+        """Map a category and user input to its cache file."""
+        key = f"{self.version}\x00{category.lower().strip()}\x00{user_input.strip()}"
+        return self.cache_dir / f"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}.json"
+
+    def _read(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Load a cache entry, or None if it is missing, expired or unreadable."""
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            return orjson.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except orjson.JSONDecodeError as e:
+            logger.warning(f"Ignoring unreadable question cache entry {path}: {e}")
+            return None
+
+    def _write(self, path: Path, category_data: Dict[str, Any]):
+        """Write a cache entry atomically; concurrent writers each use their own temp file."""
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        tmp_path.write_bytes(orjson.dumps(category_data))
+        tmp_path.replace(path)
+
+    async def get(self, category: str, user_input: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up cached questions for a category.
+
+        Args:
+            category: The category name
+            user_input: The user preferences the questions were generated for
+
+        Returns:
+            The cached category data, or None on a miss
+        """
+        return await asyncio.to_thread(self._read, self._path(category, user_input))
+
+    async def set(self, category: str, user_input: str, category_data: Dict[str, Any]):
+        """
+        Store generated questions for a category.
+
+        Args:
+            category: The category name
+            user_input: The user preferences the questions were generated for
+            category_data: The category with its questions
+        """
+        try:
+            await asyncio.to_thread(self._write, self._path(category, user_input), category_data)
+        except OSError as e:
+            logger.warning(f"Failed to write question cache entry for {category}: {e}")
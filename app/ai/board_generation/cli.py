@@ -6,6 +6,7 @@ import os
 import argparse
 import asyncio
 import logging
+import random
 from datetime import datetime
 
 from app.ai.board_generation.generator import BoardGenerator
@@ -18,6 +19,7 @@ async def main():
     parser = argparse.ArgumentParser(description='Generate Big Head game boards')
     parser.add_argument('--name', type=str, help='Name for the board file')
     parser.add_argument('--count', type=int, default=1, help='Number of boards to generate')
+    parser.add_argument('--parallel', type=int, default=5, help='Maximum number of boards to generate at once')
     parser.add_argument('--output-dir', type=str, default='app/game_data', help='Output directory')
     parser.add_argument('--model', type=str, default='gpt-4.1', help='LLM model to use')
     parser.add_argument('--no-double-big-heads', action='store_true', help='Disable double big heads')
@@ -26,28 +28,35 @@ async def main():
     
     args = parser.parse_args()
     
-    generator = BoardGenerator(
+    async with BoardGenerator(
         output_dir=args.output_dir,
         model=args.model,
         user_input=args.user_input
-    )
-    
-    for i in range(args.count):
-        if args.count > 1:
-            if args.name:
+    ) as generator:
+        # Boards are independent, so build them concurrently with a bound on boards in flight
+        semaphore = asyncio.Semaphore(max(1, args.parallel))
+        # One timestamp per run; the index keeps unnamed boards from colliding within a second
+        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        
+        async def generate_one(i: int):
+            if not args.name:
+                board_name = f"generated_{timestamp}_{i+1}"
+            elif args.count > 1:
                 board_name = f"{args.name}_{i+1}"
             else:
-                timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-                board_name = f"generated_{timestamp}_{i+1}"
-        else:
-            board_name = args.name
-        
-        file_path = await generator.generate_and_save_board(
-            board_name=board_name,
-            add_double_big_heads=not args.no_double_big_heads
-        )
+                board_name = args.name
+            
+            async with semaphore:
+                # Give each board of a batch its own seed so they don't share cached responses
+                file_path = await generator.generate_and_save_board(
+                    board_name=board_name,
+                    add_double_big_heads=not args.no_double_big_heads,
+                    cache_bust=random.randint(0, 2**31) if args.count > 1 else None
+                )
+            
+            print(f"Generated board saved to: {file_path}")
         
-        print(f"Generated board saved to: {file_path}")
+        await asyncio.gather(*(generate_one(i) for i in range(args.count)))
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
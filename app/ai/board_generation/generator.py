@@ -3,23 +3,56 @@ Board Generator module for creating Big Head game data using LLM calls.
 """
 
 import os
-import json
 import random
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Type, TypeVar
 from datetime import datetime
+from dataclasses import replace
+
+import aiohttp
+import orjson
+from pydantic import BaseModel, ValidationError
 
 from app.ai.utils.llm import LLMClient, LLMConfig
+from app.ai.board_generation.cache import CategoryQuestionCache
+from app.ai.board_generation.schemas import (
+    BoardResponse,
+    CategoriesResponse,
+    CategoryResponse,
+    FinalBigHeadResponse,
+)
 
 logger = logging.getLogger(__name__)
 
+ResponseModel = TypeVar("ResponseModel", bound=BaseModel)
+
+# Attempts per LLM call before falling back to placeholder content
+MAX_VALIDATION_ATTEMPTS = 3
+
+# Prompt templates used by the generator, compiled once per instance
+BOARD_TEMPLATES = [
+    "board_full_generation.j2",
+    "board_full_generation_prompt.j2",
+    "board_category_generation.j2",
+    "board_category_generation_prompt.j2",
+    "board_question_generation.j2",
+    "board_question_generation_prompt.j2",
+    "board_final_big_head.j2",
+    "board_final_big_head_prompt.j2",
+]
+
+# (category index, question index) pairs eligible for a double big head; $200 questions are skipped
+DOUBLE_BIG_HEAD_SLOTS = [(cat_idx, q_idx) for cat_idx in range(5) for q_idx in range(1, 5)]
+
 class BoardGenerator:
     """
     Generates Big Head game boards with categories and questions using LLM.
     """
 
-    def __init__(self, output_dir: str = "app/game_data", model: str = "gpt-4.1", user_input: str = ""):
+    def __init__(self, output_dir: str = "app/game_data", model: str = "gpt-4.1", user_input: str = "",
+                 max_concurrency: int = 5, llm_client: Optional[LLMClient] = None,
+                 question_cache: Optional[CategoryQuestionCache] = None):
         """
         Initialize the board generator.
         
@@ -27,100 +60,158 @@ class BoardGenerator:
             output_dir: Directory where generated boards will be saved
             model: LLM model to use for generation
             user_input: User preferences or requests for the game content
+            max_concurrency: Maximum number of LLM requests in flight at once
+            llm_client: Optional client shared with other generators, reusing its
+                compiled templates and response cache
+            question_cache: Optional disk cache consulted before generating a category's questions
         """
         self.output_dir = output_dir
         self.user_input = user_input
-        self.llm_client = LLMClient(
-            config=LLMConfig(
-                model=model,
-                temperature=0.7,
-                max_tokens=2000,
-                response_format={"type": "json_object"}
-            )
+        self._sem = asyncio.Semaphore(max_concurrency)
+        base_config = LLMConfig(
+            model=model,
+            temperature=0.7,
+            max_tokens=2000,
+            response_format={"type": "json_object"}
         )
+        self.llm_client = llm_client or LLMClient(config=base_config)
+        self.question_cache = question_cache
+        # Size each endpoint's token budget to its response instead of one 2000-token cap
+        self.categories_config = replace(base_config, max_tokens=200)
+        self.questions_config = replace(base_config, max_tokens=800)
+        self.final_config = replace(base_config, max_tokens=300)
+        # The single-shot board response carries 25 clues, so it needs a larger budget
+        self.full_board_config = replace(base_config, max_tokens=6000)
+        self.llm_client.prompt_manager.precompile(*BOARD_TEMPLATES)
         os.makedirs(output_dir, exist_ok=True)
+    
+    async def __aenter__(self) -> "BoardGenerator":
+        """Open one pooled HTTP session shared by every LLM call made inside the block."""
+        connector = aiohttp.TCPConnector(limit=20, ttl_dns_cache=300, keepalive_timeout=60)
+        self.llm_client.session = aiohttp.ClientSession(connector=connector)
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        """Close the shared HTTP session."""
+        session = self.llm_client.session
+        self.llm_client.session = None
+        if session and not session.closed:
+            await session.close()
+        
+    async def _request_validated(self, response_model: Type[ResponseModel], user_template: str,
+                                 system_template: str, user_context: Dict[str, Any],
+                                 config: Optional[LLMConfig] = None, use_cache: bool = False) -> ResponseModel:
+        """
+        Call the LLM and validate the response, retrying with jittered backoff on schema errors.
         
-    async def generate_categories(self) -> List[str]:
+        Args:
+            response_model: Pydantic model the response must match
+            user_template: Name of the user prompt template file
+            system_template: Name of the system prompt template file
+            user_context: Context variables for the user template
+            config: Optional config override for this endpoint
+            use_cache: Whether the first attempt may be served from the response cache
+        
+        Returns:
+            The validated response model
+        
+        Raises:
+            ValidationError: If every attempt returned an invalid response
+        """
+        for attempt in range(MAX_VALIDATION_ATTEMPTS):
+            try:
+                async with self._sem:
+                    result = await self.llm_client.chat_with_template(
+                        user_template=user_template,
+                        user_context=user_context,
+                        system_template=system_template,
+                        config=config,
+                        use_cache=use_cache,
+                        # Only responses that match the schema are cached
+                        validate=response_model.model_validate_json,
+                    )
+                return response_model.model_validate_json(result)
+            except ValidationError as e:
+                if attempt == MAX_VALIDATION_ATTEMPTS - 1:
+                    raise
+                delay = min(2 ** attempt, 4) * random.uniform(0.5, 1.5)
+                logger.warning(f"Invalid LLM response for {user_template} (attempt {attempt + 1}/"
+                               f"{MAX_VALIDATION_ATTEMPTS}): {e}. Retrying in {delay:.1f}s...")
+                await asyncio.sleep(delay)
+    
+    def _resolve_user_input(self, user_input: Optional[str]) -> str:
+        """Per-call user preferences win over the ones the generator was built with."""
+        return self.user_input if user_input is None else user_input
+    
+    async def generate_categories(self, cache_bust: Optional[int] = None, user_input: Optional[str] = None) -> List[str]:
         """
         Generate 5 diverse Big Head category names.
         
+        Args:
+            cache_bust: Optional seed; calls with different seeds never share a cached response
+            user_input: Optional user preferences (defaults to the generator's user_input)
+        
         Returns:
             List of 5 category names
         """
-        result = await self.llm_client.chat_with_template(
-            user_template="board_category_generation_prompt.j2",
-            user_context={"user_input": self.user_input},
-            system_template="board_category_generation.j2",
-        )
-        
         try:
-            response_obj = json.loads(result)
-            if not isinstance(response_obj, dict) or "categories" not in response_obj:
-                logger.warning("LLM response missing 'categories' attribute, using default")
-                return ["History", "Science", "Literature", "Geography", "Pop Culture"]
-                
-            categories = response_obj["categories"]
-            if not isinstance(categories, list) or len(categories) != 5:
-                logger.warning("LLM didn't return 5 categories, using default")
-                return ["History", "Science", "Literature", "Geography", "Pop Culture"]
-            return categories
-        except json.JSONDecodeError:
-            logger.error(f"Failed to parse LLM response as JSON: {result}")
+            response = await self._request_validated(
+                CategoriesResponse,
+                user_template="board_category_generation_prompt.j2",
+                system_template="board_category_generation.j2",
+                user_context={"user_input": self._resolve_user_input(user_input), "cache_bust": cache_bust},
+                config=self.categories_config,
+                use_cache=True,
+            )
+            return response.categories
+        except ValidationError as e:
+            logger.error(f"LLM categories response didn't match schema, using default: {e}")
             return ["History", "Science", "Literature", "Geography", "Pop Culture"]
     
-    async def generate_questions_for_category(self, category: str) -> Dict[str, Any]:
+    async def generate_questions_for_category(self, category: str, user_input: Optional[str] = None) -> Dict[str, Any]:
         """
         Generate 5 questions of increasing difficulty for a category.
         
         Args:
             category: The category name
+            user_input: Optional user preferences (defaults to the generator's user_input)
         
         Returns:
             Dict with category object containing questions
         """
-        result = await self.llm_client.chat_with_template(
-            user_template="board_question_generation_prompt.j2",
-            user_context={"category": category, "user_input": self.user_input},
-            system_template="board_question_generation.j2",
-        )
+        user_input = self._resolve_user_input(user_input)
+        if self.question_cache:
+            cached = await self.question_cache.get(category, user_input)
+            if cached is not None:
+                logger.info(f"Using cached questions for {category}")
+                return cached
         
         try:
-            response_obj = json.loads(result)
-            if not isinstance(response_obj, dict) or "category_data" not in response_obj:
-                logger.warning(f"LLM response missing 'category_data' attribute for {category}")
-                return self._create_fallback_category(category)
-                
-            category_data = response_obj["category_data"]
-            if "name" not in category_data or "questions" not in category_data:
-                logger.warning(f"LLM didn't return proper category structure for {category}")
-                return self._create_fallback_category(category)
-                
-            # Validate questions
-            questions = category_data["questions"]
-            if len(questions) != 5:
-                logger.warning(f"LLM didn't return 5 questions for {category}")
-                questions = questions[:5] if len(questions) > 5 else questions
-                while len(questions) < 5:
-                    questions.append({
-                        "clue": f"Placeholder clue for {category}",
-                        "answer": "Placeholder answer",
-                        "value": 200 * (len(questions) + 1),
-                        "double_big_head": False,
-                        "type": "text"
-                    })
-                category_data["questions"] = questions
-                
-            # Ensure values are correct
-            values = [200, 400, 600, 800, 1000]
-            for i, question in enumerate(questions):
-                question["value"] = values[i]
-                question["double_big_head"] = False
-                
+            response = await self._request_validated(
+                CategoryResponse,
+                user_template="board_question_generation_prompt.j2",
+                system_template="board_question_generation.j2",
+                user_context={"category": category, "user_input": user_input},
+                config=self.questions_config,
+            )
+            category_data = self._normalize_questions(response.category_data.model_dump())
+            # Only real LLM output is cached; placeholder fallbacks are not
+            if self.question_cache:
+                await self.question_cache.set(category, user_input, category_data)
             return category_data
-        except json.JSONDecodeError:
-            logger.error(f"Failed to parse LLM response as JSON for {category}: {result}")
+        except ValidationError as e:
+            logger.error(f"LLM response for {category} didn't match schema: {e}")
             return self._create_fallback_category(category)
     
+    def _normalize_questions(self, category_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Pin question values to 200..1000 in order and clear any double big head flags."""
+        values = [200, 400, 600, 800, 1000]
+        for i, question in enumerate(category_data["questions"]):
+            question["value"] = values[i]
+            question["double_big_head"] = False
+            
+        return category_data
+    
     def _create_fallback_category(self, category: str) -> Dict[str, Any]:
         """Create a fallback category if LLM generation fails."""
         return {
@@ -164,52 +255,91 @@ class BoardGenerator:
             ]
         }
     
-    async def generate_board(self, board_name: Optional[str] = None, add_double_big_heads: bool = True) -> Dict[str, Any]:
+    async def generate_full_board(self, cache_bust: Optional[int] = None,
+                                  user_input: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Generate all categories, questions and the Final Big Head in a single LLM call.
+        
+        Args:
+            cache_bust: Optional seed; calls with different seeds never share a cached response
+            user_input: Optional user preferences (defaults to the generator's user_input)
+        
+        Returns:
+            Dict with "categories" and "final" keys, or None if the response was unusable
+        """
+        try:
+            async with self._sem:
+                result = await self.llm_client.chat_with_template(
+                    user_template="board_full_generation_prompt.j2",
+                    user_context={"user_input": self._resolve_user_input(user_input), "cache_bust": cache_bust},
+                    system_template="board_full_generation.j2",
+                    config=self.full_board_config,
+                    use_cache=True,
+                    # A malformed board must not be cached, or every retry skips to the fallback
+                    validate=BoardResponse.model_validate_json,
+                )
+            board = BoardResponse.model_validate_json(result)
+        except ValidationError as e:
+            logger.warning(f"Full board response didn't match schema: {e}")
+            return None
+        except Exception as e:
+            logger.warning(f"Single-shot board generation failed: {e}")
+            return None
+        
+        category_data = [self._normalize_questions(category.model_dump()) for category in board.categories]
+        final = board.final_big_head.model_dump()
+        
+        return {"categories": category_data, "final": final}
+    
+    async def _generate_board_piecewise(self, cache_bust: Optional[int] = None,
+                                        user_input: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Fallback generation path: one call for categories, one per category, one for the final.
+        
+        Args:
+            cache_bust: Optional seed forwarded to the cached category/final calls
+            user_input: Optional user preferences (defaults to the generator's user_input)
+        
+        Returns:
+            Dict with "categories" and "final" keys
+        """
+        categories = await self.generate_categories(cache_bust, user_input)
+        logger.info(f"Generated categories: {categories}")
+        
+        category_data = await asyncio.gather(
+            *(self.generate_questions_for_category(category, user_input) for category in categories)
+        )
+        final_big_head = await self._generate_final_big_head(cache_bust, user_input)
+        
+        return {"categories": list(category_data), "final": final_big_head}
+    
+    async def generate_board(self, board_name: Optional[str] = None, add_double_big_heads: bool = True,
+                             cache_bust: Optional[int] = None, user_input: Optional[str] = None) -> Dict[str, Any]:
         """
         Generate a complete Big Head board with 5 categories and 25 questions.
         
         Args:
             board_name: Optional name for the board file
             add_double_big_heads: Whether to add daily doubles (1-2 random questions)
+            cache_bust: Optional seed so boards generated from the same input don't share cached responses
+            user_input: Optional user preferences (defaults to the generator's user_input)
         
         Returns:
             Complete board data as a dictionary
         """
-        # Generate categories
-        categories = await self.generate_categories()
-        logger.info(f"Generated categories: {categories}")
+        generated = await self.generate_full_board(cache_bust, user_input)
+        if generated is None:
+            logger.info("Falling back to per-category board generation")
+            generated = await self._generate_board_piecewise(cache_bust, user_input)
         
-        # Generate questions for each category concurrently
-        category_tasks = []
-        for category in categories:
-            task = self.generate_questions_for_category(category)
-            category_tasks.append(task)
+        category_data = generated["categories"]
+        logger.info(f"Generated categories: {[cat['name'] for cat in category_data]}")
         
-        # Wait for all categories to be generated
-        category_data = await asyncio.gather(*category_tasks)
-        
-        # Add daily doubles if requested
+        # Add 1-2 daily doubles if requested
         if add_double_big_heads:
-            # Add 1-2 daily doubles, excluding $200 questions
-            double_big_head_count = random.randint(1, 2)
-            excludes = []
-            for _ in range(double_big_head_count):
-                while True:
-                    cat_idx = random.randint(0, 4)
-                    q_idx = random.randint(1, 4)  # Skip $200 questions
-                    if (cat_idx, q_idx) not in excludes:
-                        category_data[cat_idx]["questions"][q_idx]["double_big_head"] = True
-                        excludes.append((cat_idx, q_idx))
-                        break
-        
-        # Generate Final Big Head
-        final_big_head = await self._generate_final_big_head()
+            for cat_idx, q_idx in random.sample(DOUBLE_BIG_HEAD_SLOTS, random.randint(1, 2)):
+                category_data[cat_idx]["questions"][q_idx]["double_big_head"] = True
         
-        # Create the full board data
-        if not board_name:
-            timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-            board_name = f"generated_{timestamp}"
-            
         board_data = {
             "contestants": [
                 {"name": "Player 1", "score": 0},
@@ -217,132 +347,68 @@ class BoardGenerator:
                 {"name": "Player 3", "score": 0}
             ],
             "categories": category_data,
-            "final": final_big_head
+            "final": generated["final"]
         }
         
         return board_data
     
-    async def _generate_final_big_head(self) -> Dict[str, str]:
+    async def _generate_final_big_head(self, cache_bust: Optional[int] = None,
+                                       user_input: Optional[str] = None) -> Dict[str, str]:
         """
         Generate a Final Big Head category, clue, and answer.
         
+        Args:
+            cache_bust: Optional seed; calls with different seeds never share a cached response
+            user_input: Optional user preferences (defaults to the generator's user_input)
+        
         Returns:
             Dictionary with final Big Head data
         """
-        result = await self.llm_client.chat_with_template(
-            user_template="board_final_big_head_prompt.j2",
-            user_context={"user_input": self.user_input},
-            system_template="board_final_big_head.j2",
-        )
-        
         try:
-            response_obj = json.loads(result)
-            if not isinstance(response_obj, dict) or "final_big_head" not in response_obj:
-                logger.warning("LLM response missing 'final_big_head' attribute")
-                return {
-                    "category": "Final Big Head",
-                    "clue": "This is a placeholder for the final Big Head clue",
-                    "answer": "Placeholder answer"
-                }
-                
-            final = response_obj["final_big_head"]
-            required_keys = ["category", "clue", "answer"]
-            if not all(key in final for key in required_keys):
-                logger.warning("LLM didn't return proper Final Big Head structure")
-                return {
-                    "category": "Final Big Head",
-                    "clue": "This is a placeholder for the final Big Head clue",
-                    "answer": "Placeholder answer"
-                }
-                
-            return final
-        except json.JSONDecodeError:
-            logger.error(f"Failed to parse LLM response as JSON for Final Big Head: {result}")
+            response = await self._request_validated(
+                FinalBigHeadResponse,
+                user_template="board_final_big_head_prompt.j2",
+                system_template="board_final_big_head.j2",
+                user_context={"user_input": self._resolve_user_input(user_input), "cache_bust": cache_bust},
+                config=self.final_config,
+                use_cache=True,
+            )
+            return response.final_big_head.model_dump()
+        except ValidationError as e:
+            logger.error(f"LLM Final Big Head response didn't match schema: {e}")
             return {
                 "category": "Final Big Head",
                 "clue": "This is a placeholder for the final Big Head clue",
                 "answer": "Placeholder answer"
             }
     
-    async def generate_and_save_board(self, board_name: Optional[str] = None, add_double_big_heads: bool = True, user_input: Optional[str] = None) -> str:
+    async def generate_and_save_board(self, board_name: Optional[str] = None, add_double_big_heads: bool = True, user_input: Optional[str] = None,
+                                      cache_bust: Optional[int] = None) -> str:
         """
         Generate a board and save it to a JSON file.
         
         Args:
             board_name: Optional name for the board file
             add_double_big_heads: Whether to add daily doubles
-            user_input: Optional user preferences (overwrites the object's user_input if provided)
+            user_input: Optional user preferences for this board only (defaults to the generator's user_input)
+            cache_bust: Optional seed so repeated boards don't reuse cached LLM responses
             
         Returns:
             Path to the saved JSON file
         """
-        # Update user input if provided
-        original_user_input = self.user_input
-        if user_input is not None:
-            self.user_input = user_input
-            
-        try:
-            # Generate categories first
-            categories = await self.generate_categories()
-            logger.info(f"Generated categories: {categories}")
-            
-            if not board_name:
-                timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-                board_name = f"generated_{timestamp}"
-            
-            # Create placeholder board data
-            board_data = {
-                "contestants": [
-                    {"name": "Player 1", "score": 0},
-                    {"name": "Player 2", "score": 0},
-                    {"name": "Player 3", "score": 0}
-                ],
-                "categories": [],
-                "final": None
-            }
-            
-            # Save initial board with placeholders
-            file_path = os.path.join(self.output_dir, f"{board_name}.json")
-            with open(file_path, 'w') as f:
-                json.dump(board_data, f, indent=2)
-            
-            # Generate questions for each category concurrently
-            category_tasks = []
-            for category in categories:
-                task = self.generate_questions_for_category(category)
-                category_tasks.append(task)
-            
-            # Wait for all categories to be generated
-            category_data = await asyncio.gather(*category_tasks)
-            
-            # Add daily doubles if requested
-            if add_double_big_heads:
-                # Add 1-2 daily doubles, excluding $200 questions
-                double_big_head_count = random.randint(1, 2)
-                excludes = []
-                for _ in range(double_big_head_count):
-                    while True:
-                        cat_idx = random.randint(0, 4)
-                        q_idx = random.randint(1, 4)  # Skip $200 questions
-                        if (cat_idx, q_idx) not in excludes:
-                            category_data[cat_idx]["questions"][q_idx]["double_big_head"] = True
-                            excludes.append((cat_idx, q_idx))
-                            break
-            
-            # Generate Final Big Head
-            final_big_head = await self._generate_final_big_head()
-            
-            # Update board data with all categories and final big head
-            board_data["categories"] = category_data
-            board_data["final"] = final_big_head
-            
-            # Save complete board data
-            with open(file_path, 'w') as f:
-                json.dump(board_data, f, indent=2)
-            
-            logger.info(f"Board saved to {file_path}")
-            return file_path
-        finally:
-            # Restore original user input
-            if user_input is not None:
-                self.user_input = original_user_input 
\ No newline at end of file
+        if not board_name:
+            timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+            board_name = f"generated_{timestamp}"
+        
+        # Generate the full board (single LLM call, per-category fallback)
+        board_data = await self.generate_board(board_name, add_double_big_heads, cache_bust, user_input)
+        
+        # Write once, atomically, so readers never see a partial board
+        file_path = os.path.join(self.output_dir, f"{board_name}.json")
+        tmp_path = f"{file_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(board_data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, file_path)
+        
+        logger.info(f"Board saved to {file_path}")
+        return file_path
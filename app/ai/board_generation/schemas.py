@@ -0,0 +1,43 @@
+"""
+Pydantic schemas for the JSON returned by the board generation prompts.
+"""
+
+from typing import List, Literal
+
+from pydantic import BaseModel, Field
+
+
+class GeneratedQuestion(BaseModel):
+    clue: str
+    answer: str
+    value: Literal[200, 400, 600, 800, 1000]
+    double_big_head: bool = False
+    type: Literal["text"] = "text"
+
+
+class GeneratedCategory(BaseModel):
+    name: str
+    questions: List[GeneratedQuestion] = Field(min_length=5, max_length=5)
+
+
+class GeneratedFinalBigHead(BaseModel):
+    category: str
+    clue: str
+    answer: str
+
+
+class CategoriesResponse(BaseModel):
+    categories: List[str] = Field(min_length=5, max_length=5)
+
+
+class CategoryResponse(BaseModel):
+    category_data: GeneratedCategory
+
+
+class FinalBigHeadResponse(BaseModel):
+    final_big_head: GeneratedFinalBigHead
+
+
+class BoardResponse(BaseModel):
+    categories: List[GeneratedCategory] = Field(min_length=5, max_length=5)
+    final_big_head: GeneratedFinalBigHead
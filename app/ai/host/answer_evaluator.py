@@ -5,12 +5,55 @@ Answer evaluation for Big Head questions
 import logging
 import os
 import re
+from collections import OrderedDict
 from typing import Dict, Any, Optional
 
 from ..utils.llm import LLMClient, LLMConfig
 
 logger = logging.getLogger(__name__)
 
+# Leading "what is"/"who are" style phrasing, which never changes whether an answer is right
+_QUESTION_PREFIX = re.compile(r'^(what|who|where|when)\s+(is|are|was|were)\s+')
+
+
+# Filler that only rephrases an answer: "it's ...", "I think ...", leading articles
+_ANSWER_FILLER = re.compile(r"^(?:(?:i think|maybe|it'?s|it is|that'?s|that is|is it)\s+)*(?:(?:the|a|an)\s+)?")
+_TRAILING_PUNCT = re.compile(r"[\s?!.,;:]+$")
+_LEADING_ARTICLE = re.compile(r"^(?:the|a|an)\s+")
+_WHITESPACE = re.compile(r"\s+")
+_HTML_TAG = re.compile(r'<[^>]+>')
+
+
+def _normalize_player_answer(player_answer: str) -> str:
+    """Lowercase an answer and strip question phrasing and trailing punctuation."""
+    return _QUESTION_PREFIX.sub('', player_answer.strip().lower()).strip('? ')
+
+
+def _answer_cache_form(player_answer: str) -> str:
+    """
+    Reduce an answer to the form used in the evaluation cache key.
+
+    Paraphrases such as "Who is Einstein?", "it's einstein" and "Einstein!" all map
+    to "einstein", so they share one LLM verdict. Only trailing punctuation is dropped;
+    "C++", "C#" and "C", or "-40" and "40", stay distinct answers.
+    """
+    answer = _WHITESPACE.sub(' ', _normalize_player_answer(player_answer))
+    answer = _ANSWER_FILLER.sub('', answer)
+    return _TRAILING_PUNCT.sub('', answer).strip()
+
+
+def _exact_answer_form(answer: str) -> str:
+    """
+    Reduce an answer to the form compared by the exact-match shortcut.
+
+    Only case, "what is" phrasing, a leading article, whitespace and a trailing "?" or "!"
+    are dropped; symbols and signs are kept, so "C" never matches "C++" and "40" never
+    matches "-40".
+    """
+    answer = _WHITESPACE.sub(' ', _QUESTION_PREFIX.sub('', answer.strip().lower()))
+    return _LEADING_ARTICLE.sub('', answer).rstrip('?! ')
+
+
 class AnswerEvaluator:
     """Evaluates player answers for correctness using LLM"""
     
@@ -21,6 +64,9 @@ class AnswerEvaluator:
             temperature=0.3,
             response_format={"type": "json_object"}
         )
+        # LRU of LLM verdicts keyed by the clue and the paraphrase-insensitive player answer
+        self.evaluation_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self.evaluation_cache_size = 512
     
     async def evaluate_answer(self, expected_answer: str, player_answer: str,
                             clue: str = "", category: str = "",
@@ -43,14 +89,34 @@ class AnswerEvaluator:
         # TEST_MODE: simple string matching instead of LLM
         if os.environ.get("TEST_MODE"):
             # Strip HTML tags from expected answer
-            clean_expected = re.sub(r'<[^>]+>', '', expected_answer).strip().lower()
+            clean_expected = _HTML_TAG.sub('', expected_answer).strip().lower()
             # Strip "what is", "who is" etc. prefixes from player answer
-            clean_player = re.sub(r'^(what|who|where|when)\s+(is|are|was|were)\s+', '', player_answer.strip().lower())
-            clean_player = clean_player.strip('? ')
+            clean_player = _normalize_player_answer(player_answer)
             is_correct = clean_player in clean_expected or clean_expected in clean_player
             logger.info(f"TEST_MODE: '{clean_player}' vs '{clean_expected}' = {is_correct}")
             return {"is_correct": is_correct, "explanation": "Test mode"}
         
+        # An answer identical to the board answer apart from phrasing is right; only
+        # near misses and paraphrases need the LLM
+        player_form = _exact_answer_form(player_answer)
+        if player_form and player_form == _exact_answer_form(_HTML_TAG.sub('', expected_answer)):
+            logger.info("Exact match with expected answer, skipping LLM evaluation")
+            explanation = "The answer matches exactly." if include_explanation else ""
+            return {"is_correct": True, "explanation": explanation}
+
+        cache_key = (
+            expected_answer.strip().lower(),
+            _answer_cache_form(player_answer),
+            clue,
+            category,
+            include_explanation,
+        )
+        cached = self.evaluation_cache.get(cache_key)
+        if cached is not None:
+            self.evaluation_cache.move_to_end(cache_key)
+            logger.info(f"Using cached evaluation: correct={cached['is_correct']}")
+            return dict(cached)
+
         try:
             # Use template-based approach for the prompt
             user_context = {
@@ -74,7 +140,12 @@ class AnswerEvaluator:
                 explanation = response.get("explanation", "No explanation provided") if include_explanation else ""
                 
                 logger.info(f"LLM evaluation: correct={is_correct}, reason: {explanation}")
-                return {"is_correct": is_correct, "explanation": explanation}
+                result = {"is_correct": is_correct, "explanation": explanation}
+                # Only real verdicts are cached; errors below fall through uncached
+                self.evaluation_cache[cache_key] = result
+                if len(self.evaluation_cache) > self.evaluation_cache_size:
+                    self.evaluation_cache.popitem(last=False)
+                return dict(result)
             except json.JSONDecodeError:
                 logger.error(f"Failed to parse LLM response as JSON: {response_text}")
                 return {"is_correct": False, "explanation": "Error evaluating answer."}
@@ -4,8 +4,9 @@ Audio management for the AI host
 
 import logging
 import asyncio
+import hashlib
+import itertools
 import os
-import time
 from typing import Optional, Deque, Set
 from pathlib import Path
 from collections import deque
@@ -15,6 +16,17 @@ from .utils.helpers import cleanup_audio_files
 
 logger = logging.getLogger(__name__)
 
+def _is_nonempty_file(path: str) -> bool:
+    """Check that path exists and has content."""
+    return os.path.exists(path) and os.path.getsize(path) > 0
+
+def _touch_if_cached(path: str) -> bool:
+    """Refresh the mtime of an existing audio file so cleanup keeps it; False if it isn't cached."""
+    if not _is_nonempty_file(path):
+        return False
+    os.utime(path)
+    return True
+
 class AudioManager:
     """Manages audio queue and playback for the AI host"""
 
@@ -22,15 +34,22 @@ class AudioManager:
         """Initialize the audio manager"""
         self.tts_client = TTSClient(api_key=api_key)
         self.tts_voice = voice
-        self.audio_queue = asyncio.Queue()
-        self.is_playing_audio = False
+        self.audio_queue: asyncio.Queue = asyncio.Queue()
+        self._queue_task: Optional[asyncio.Task] = None
         self.game_service = None
         self.game_instance = None
         self.question_audio_id = None
         self.incorrect_answer_audio_id = None
-        self.recent_audio_files = set()
-        self.max_recent_files = 10
+        # Per-manager sequence for audio IDs; unique even for cues started in the same second
+        self._audio_counter = itertools.count()
+        # Filenames being synthesized right now; finished files are cached on disk
+        self.synthesizing_files: Set[str] = set()
         self._stream_lock = asyncio.Lock()
+        self._cleanup_task: Optional[asyncio.Task] = None
+
+        # Directory for file-based TTS output, created once up front
+        self.static_dir = os.path.join("static", "audio")
+        os.makedirs(self.static_dir, exist_ok=True)
 
     @property
     def game_id(self):
@@ -49,13 +68,15 @@ class AudioManager:
         if os.environ.get("TEST_MODE"):
             logger.info("TEST_MODE: Skipping audio queue processor")
             return
-        self.is_playing_audio = True
-        asyncio.create_task(self.process_audio_queue())
+        self._queue_task = asyncio.create_task(self.process_audio_queue())
         logger.debug("Audio queue processor started")
         
     def shutdown(self):
         """Shut down the audio manager"""
-        self.is_playing_audio = False
+        # Cancelling the processor also interrupts any in-flight playback wait
+        if self._queue_task:
+            self._queue_task.cancel()
+            self._queue_task = None
         # Schedule cleanup of the aiohttp session
         asyncio.ensure_future(self.tts_client.close())
         logger.debug("Audio manager shutting down")
@@ -94,6 +115,12 @@ class AudioManager:
         was_incorrect = self.clear_incorrect_answer_audio_id(audio_id)
         return (was_question, was_incorrect)
 
+    def _schedule_cleanup(self, static_dir: str):
+        """Start a background audio file cleanup unless one is already running."""
+        if self._cleanup_task and not self._cleanup_task.done():
+            return
+        self._cleanup_task = asyncio.create_task(cleanup_audio_files(static_dir, 5))
+
     async def synthesize_and_play_speech(self, text: str, is_question_audio=False, is_incorrect_answer_audio=False):
         """
         Synthesize speech from text and play it to all clients.
@@ -110,17 +137,18 @@ class AudioManager:
         try:
             logger.debug(f"Converting to speech: {text}")
             
-            # Generate unique filename with timestamp
-            timestamp = int(time.time())
-            filename = f"question_audio_{timestamp}.wav"
+            # Name the file after its content so identical lines reuse earlier synthesis
+            key = hashlib.blake2b(f"{self.tts_voice}\x00{text}".encode(), digest_size=16).hexdigest()
+            filename = f"question_audio_{key}.wav"
+            seq = next(self._audio_counter)
             
             # Generate a unique audio ID that will be used to track this playback
             if is_incorrect_answer_audio:
                 # Mark incorrect answer audio specially
-                audio_id = f"audio_incorrect_{timestamp}"
+                audio_id = f"audio_incorrect_{seq}"
                 logger.debug(f"Saved incorrect answer audio ID: {audio_id}")
             else:
-                audio_id = f"audio_{timestamp}"
+                audio_id = f"audio_{seq}"
                 logger.debug(f"Saved audio ID: {audio_id}")
             
             # If this audio is for a question, track its ID
@@ -128,34 +156,36 @@ class AudioManager:
                 self.question_audio_id = audio_id
                 logger.debug(f"Setting question audio ID to {self.question_audio_id}")
             
-            # If this is a duplicate speech request for the same file, skip it
-            if filename in self.recent_audio_files:
+            # If the same text is already being synthesized, skip it
+            if filename in self.synthesizing_files:
                 logger.warning(f"Skipping duplicate speech synthesis for file: {filename}")
                 return
                 
-            # Add to recent files set before generating to prevent race conditions
-            self.recent_audio_files.add(filename)
+            # Mark in-flight before generating to prevent race conditions
+            self.synthesizing_files.add(filename)
             
-            # Limit the size of recent files set
-            if len(self.recent_audio_files) > 20:
-                oldest_files = sorted(self.recent_audio_files)[:10]  # Sort by timestamp in filename
-                self.recent_audio_files = self.recent_audio_files - set(oldest_files)
-            
-            # Create paths for audio files
-            static_dir = os.path.join("static", "audio")
-            
-            # Ensure directories exist
-            os.makedirs(static_dir, exist_ok=True)
-            
-            # Generate speech - use the correct method name from TTSClient
-            output_path = os.path.join(static_dir, filename)
-            result_file = self.tts_client.generate_speech(
-                text=text,
-                voice_name=self.tts_voice,
-                output_file=output_path
-            )
+            # Blocking filesystem and TTS calls run in a worker thread to keep the event loop free
+            output_path = os.path.join(self.static_dir, filename)
+            try:
+                if await asyncio.to_thread(_touch_if_cached, output_path):
+                    # Same voice and text were synthesized before
+                    logger.debug(f"Reusing cached speech file: {output_path}")
+                    result_file = output_path
+                else:
+                    # Generate speech - use the correct method name from TTSClient
+                    result_file = await asyncio.to_thread(
+                        self.tts_client.generate_speech,
+                        text=text,
+                        voice_name=self.tts_voice,
+                        output_file=output_path,
+                        # The path is a cache key reused across games; never store an undecodable body there
+                        save_raw_on_error=False
+                    )
+            finally:
+                # The file on disk is the cache; only in-flight syntheses stay in the set
+                self.synthesizing_files.discard(filename)
             
-            if os.path.exists(result_file) and os.path.getsize(result_file) > 0:
+            if await asyncio.to_thread(_is_nonempty_file, result_file):
                 # Add to audio queue instead of playing immediately
                 public_url = f"/static/audio/{filename}"
                 logger.debug(f"Adding audio to queue: {public_url} (id: {audio_id})")
@@ -163,15 +193,13 @@ class AudioManager:
                 # Store (url, audio_id) tuple so we use the same ID throughout
                 await self.audio_queue.put((public_url, audio_id))
                 
-                # Clean up old audio files
-                await cleanup_audio_files(static_dir, 5)
+                # Clean up old audio files in the background
+                self._schedule_cleanup(self.static_dir)
             else:
                 logger.error(f"Failed to create valid audio file at: {result_file}")
             
         except Exception as e:
-            logger.error(f"Error synthesizing speech: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error synthesizing speech: {e}")
     
     async def synthesize_and_stream_speech(self, text: str, is_question_audio=False, is_incorrect_answer_audio=False):
         """
@@ -186,11 +214,11 @@ class AudioManager:
 
         async with self._stream_lock:
             try:
-                timestamp = int(time.time() * 1000)
+                seq = next(self._audio_counter)
                 if is_incorrect_answer_audio:
-                    audio_id = f"audio_incorrect_{timestamp}"
+                    audio_id = f"audio_incorrect_{seq}"
                 else:
-                    audio_id = f"audio_{timestamp}"
+                    audio_id = f"audio_{seq}"
 
                 if is_question_audio:
                     self.question_audio_id = audio_id
@@ -241,20 +269,18 @@ class AudioManager:
                     logger.warning(f"No game_instance to wait for streaming audio completion: {audio_id}")
 
             except Exception as e:
-                logger.error(f"Error in streaming TTS, falling back to file-based: {e}")
-                import traceback
-                logger.error(traceback.format_exc())
+                logger.exception(f"Error in streaming TTS, falling back to file-based: {e}")
                 await self.synthesize_and_play_speech(text, is_question_audio, is_incorrect_answer_audio)
 
     async def process_audio_queue(self):
         """Process the audio queue and play audio files"""
-        while self.is_playing_audio:
+        while True:
             try:
                 # Block until an item is available (no polling)
                 audio_url, stored_audio_id = await self.audio_queue.get()
 
                 # Use stored ID if available, otherwise generate one as fallback
-                audio_id = stored_audio_id or f"audio_{int(time.time() * 1000)}"
+                audio_id = stored_audio_id or f"audio_{next(self._audio_counter)}"
 
                 logger.debug(f"Processing audio from queue: {audio_url} (id: {audio_id})")
 
@@ -283,7 +309,8 @@ class AudioManager:
                     await asyncio.sleep(5)  # Default delay
                     logger.debug("No game service - simulated audio playback")
                     
+            except asyncio.CancelledError:
+                logger.debug("Audio queue processor cancelled")
+                break
             except Exception as e:
-                logger.error(f"Error processing audio queue: {e}")
-                import traceback
-                logger.error(traceback.format_exc())
\ No newline at end of file
+                logger.exception(f"Error processing audio queue: {e}")
\ No newline at end of file
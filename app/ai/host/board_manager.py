@@ -3,19 +3,57 @@ Board generation and management for the AI host
 """
 
 import logging
-import json
 import os
 import time
+import uuid
 import asyncio
+import itertools
 import random
-from typing import List, Dict, Any
-from app.ai.board_generation.generator import BoardGenerator
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+import aiohttp
+import orjson
+
+from app.ai.board_generation.generator import BoardGenerator, DOUBLE_BIG_HEAD_SLOTS
+from app.ai.board_generation.cache import CategoryQuestionCache, template_version
+from app.ai.utils.llm import LLMClient
 
 logger = logging.getLogger(__name__)
 
+# Where generated and static boards live
+GAME_DATA_DIR = Path("app/game_data")
+
+# Board files are read back by select_board, not people; only pretty-print when debugging
+BOARD_JSON_OPTIONS = orjson.OPT_INDENT_2 if os.environ.get("DEBUG") else 0
+
+# Seconds generated category questions are reused across games; 0 disables the cache
+QUESTION_CACHE_TTL = float(os.environ.get("BOARD_QUESTION_CACHE_TTL", 24 * 60 * 60))
+
+# Per-process sequence for generated board names
+_BOARD_SEQ = itertools.count()
+
+
+def _write_board_file(file_path: Path, board_data: Dict[str, Any]):
+    """Serialize a board with orjson (compact unless DEBUG is set) and atomically replace file_path with it."""
+    tmp_path = file_path.with_name(f"{file_path.name}.tmp")
+    tmp_path.write_bytes(orjson.dumps(board_data, option=BOARD_JSON_OPTIONS))
+    tmp_path.replace(file_path)
+
+
 class BoardManager:
     """Manages board generation and selection for the AI host"""
 
+    # Parsed TEST_MODE board, shared by every game once loaded
+    _questions_cache: Optional[Dict[str, Any]] = None
+    
+    # LLM client (with its compiled prompt templates and pooled HTTP session) shared by
+    # every game's board generator; the session is closed by close_shared_llm_client
+    _llm_client: Optional[LLMClient] = None
+    
+    # Generated category questions, shared by every game's board generator
+    _question_cache: Optional[CategoryQuestionCache] = None
+
     def __init__(self):
         """Initialize the board manager"""
         self.game_service = None
@@ -34,25 +72,21 @@ class BoardManager:
             preference_messages: List of messages containing user preferences
         """
         try:
+            game_id = self.game_instance.game_id if self.game_instance else None
+            
             # TEST_MODE: load static questions.json board instead of generating via LLM
             if os.environ.get("TEST_MODE"):
                 logger.info("TEST_MODE: Skipping LLM board generation, loading questions.json")
                 if self.game_service and self.game_instance:
-                    await self.game_service.select_board("questions", game_id=self.game_instance.game_id)
+                    await self.game_service.select_board("questions", game_id=game_id)
 
                     # Load questions.json to get categories for reveal animation
-                    questions_path = os.path.join("app/game_data", "questions.json")
-                    with open(questions_path, 'r') as f:
-                        board_data = json.load(f)
+                    board_data = await self._load_questions()
 
-                    # Reveal categories with short delay
-                    for i, cat_data in enumerate(board_data.get("categories", [])):
-                        await self.game_service.connection_manager.broadcast_message(
-                            "com.sc2ctl.bighead.reveal_category",
-                            {"index": i, "category": cat_data},
-                            game_id=self.game_instance.game_id
-                        )
-                        await asyncio.sleep(0.2)
+                    # Reveal categories with short delay, and let the last one appear before
+                    # the caller announces the board is ready
+                    reveal_duration = await self._reveal_categories(board_data.get("categories", []), game_id, 0.2)
+                    await asyncio.sleep(reveal_duration)
 
                     return "questions"
                 else:
@@ -60,21 +94,27 @@ class BoardManager:
                     return None
 
             # Extract user preferences from messages
-            user_preferences = " ".join([msg["message"] for msg in preference_messages])
+            user_preferences = " ".join(msg["message"] for msg in preference_messages)
             
-            # Create board generator
-            generator = BoardGenerator(user_input=user_preferences)
+            # Create board generator; six slots so the five categories and the final run together
+            generator = BoardGenerator(
+                user_input=user_preferences,
+                max_concurrency=6,
+                llm_client=self._get_llm_client(),
+                question_cache=await self._get_question_cache()
+            )
+            # The client's response cache is shared between games, so give each board its own seed
+            cache_bust = random.randint(0, 2**31)
             
             # First, generate just the category names
             logger.info("Generating categories...")
-            categories = await generator.generate_categories()
+            categories = await generator.generate_categories(cache_bust)
             logger.info(f"Generated categories: {categories}")
             
-            # Generate a unique name for this game's board
-            timestamp = time.strftime("%Y%m%d%H%M%S")
-            board_name = f"generated_{timestamp}"
+            # Generate a unique name for this game's board; games started in the same
+            # second (or in another worker process) must not share a file
+            board_name = f"generated_{int(time.time())}_{next(_BOARD_SEQ)}_{uuid.uuid4().hex[:6]}"
             
-            # Create placeholder board data
             board_data = {
                 "contestants": [
                     {"name": "Player 1", "score": 0},
@@ -84,60 +124,62 @@ class BoardManager:
                 "categories": [],
                 "final": None
             }
+            file_path = GAME_DATA_DIR / f"{board_name}.json"
             
-            # Save initial board with placeholders
-            file_path = os.path.join("app/game_data", f"{board_name}.json")
-            with open(file_path, 'w') as f:
-                json.dump(board_data, f, indent=2)
+            # The final doesn't depend on the questions, so generate it alongside them
+            final_task = asyncio.create_task(generator._generate_final_big_head(cache_bust))
             
-            # Start all category generation tasks concurrently
-            category_tasks = []
-            for category in categories:
-                task = generator.generate_questions_for_category(category)
-                category_tasks.append(task)
+            async def generate_category(index: int, category: str):
+                return index, await generator.generate_questions_for_category(category)
             
-            # Wait for all categories to be generated
-            category_data = await asyncio.gather(*category_tasks)
+            # Start all category generation tasks concurrently
+            category_tasks = [
+                asyncio.create_task(generate_category(i, category))
+                for i, category in enumerate(categories)
+            ]
+            category_data: List[Dict[str, Any]] = [None] * len(categories)
             
-            # Reveal categories one by one with a small delay
-            for i, cat_data in enumerate(category_data):
-                logger.info(f"Revealing category {i+1} of {len(categories)}: {cat_data['name']}")
-                if self.game_service:
-                    game_id = self.game_instance.game_id if self.game_instance else None
-                    await self.game_service.connection_manager.broadcast_message(
-                        "com.sc2ctl.bighead.reveal_category",
-                        {
-                            "index": i,
-                            "category": cat_data
-                        },
-                        game_id=game_id
-                    )
-                # Small delay between reveals for visual effect
-                await asyncio.sleep(0.5)
+            # Reveal each category as soon as its questions are ready, at most one every 0.5s
+            # so the reveals still animate one by one
+            loop = asyncio.get_running_loop()
+            next_reveal_at = loop.time()
+            try:
+                for next_done in asyncio.as_completed(category_tasks):
+                    i, cat_data = await next_done
+                    category_data[i] = cat_data
+                    await asyncio.sleep(max(0.0, next_reveal_at - loop.time()))
+                    # Measure the interval from the start of this reveal so broadcast time
+                    # doesn't stretch the gap to the next one
+                    next_reveal_at = loop.time() + 0.5
+                    logger.info(f"Revealing category {i+1} of {len(categories)}: {cat_data['name']}")
+                    if self.game_service:
+                        await self.game_service.connection_manager.broadcast_message(
+                            "com.sc2ctl.bighead.reveal_category",
+                            {
+                                "index": i,
+                                "category": cat_data
+                            },
+                            game_id=game_id
+                        )
+            except Exception:
+                for task in category_tasks:
+                    task.cancel()
+                final_task.cancel()
+                raise
             
-            # Add daily doubles if requested
-            double_big_head_count = random.randint(1, 2)
-            excludes = []
-            for _ in range(double_big_head_count):
-                while True:
-                    cat_idx = random.randint(0, 4)
-                    q_idx = random.randint(1, 4)  # Skip $200 questions
-                    if (cat_idx, q_idx) not in excludes:
-                        category_data[cat_idx]["questions"][q_idx]["double_big_head"] = True
-                        excludes.append((cat_idx, q_idx))
-                        break
+            # Add 1-2 daily doubles on distinct non-$200 questions
+            for cat_idx, q_idx in random.sample(DOUBLE_BIG_HEAD_SLOTS, random.randint(1, 2)):
+                category_data[cat_idx]["questions"][q_idx]["double_big_head"] = True
             
-            # Generate the final object
             board_data["categories"] = category_data
-            board_data["final"] = await generator._generate_final_big_head()
+            board_data["final"] = await final_task
             
-            # Save complete board data
-            with open(file_path, 'w') as f:
-                json.dump(board_data, f, indent=2)
+            # Save the board once, complete, off the event loop
+            await asyncio.to_thread(_write_board_file, file_path, board_data)
             
             # Set the board in the game service
             if self.game_service and self.game_instance:
-                await self.game_service.select_board(board_name, game_id=self.game_instance.game_id)
+                await self.game_service.select_board(board_name, game_id=game_id)
             elif not self.game_instance:
                 logger.error("Cannot select board - game_instance not set on BoardManager")
             
@@ -147,6 +189,77 @@ class BoardManager:
             logger.error(f"Error generating board: {e}")
             raise
     
+    @classmethod
+    def _get_llm_client(cls) -> LLMClient:
+        """Create the shared board generation LLM client and its HTTP session on first use."""
+        if cls._llm_client is None:
+            cls._llm_client = LLMClient()
+        client = cls._llm_client
+        if client.session is None or client.session.closed:
+            # One keep-alive pool for every game, so boards don't each pay a new TLS handshake
+            connector = aiohttp.TCPConnector(limit=20, ttl_dns_cache=300, keepalive_timeout=60)
+            client.session = aiohttp.ClientSession(connector=connector)
+        return client
+    
+    @classmethod
+    async def close_shared_llm_client(cls):
+        """Close the shared LLM client's HTTP session; called on application shutdown."""
+        client = cls._llm_client
+        if client and client.session and not client.session.closed:
+            await client.session.close()
+            logger.info("Closed shared board generation LLM session")
+    
+    @classmethod
+    async def _get_question_cache(cls) -> Optional[CategoryQuestionCache]:
+        """Create the shared question cache on first use, keyed to the current question prompts."""
+        if QUESTION_CACHE_TTL <= 0:
+            return None
+        if cls._question_cache is None:
+            version = await asyncio.to_thread(
+                template_version,
+                cls._get_llm_client().prompt_manager,
+                "board_question_generation.j2",
+                "board_question_generation_prompt.j2",
+            )
+            cls._question_cache = CategoryQuestionCache(GAME_DATA_DIR / "cache", QUESTION_CACHE_TTL, version)
+        return cls._question_cache
+    
+    @classmethod
+    async def _load_questions(cls) -> Dict[str, Any]:
+        """Read and parse questions.json on first use, then serve the cached board."""
+        if cls._questions_cache is None:
+            questions_path = GAME_DATA_DIR / "questions.json"
+            data = await asyncio.to_thread(questions_path.read_bytes)
+            cls._questions_cache = orjson.loads(data)
+        return cls._questions_cache
+    
+    async def _reveal_categories(self, categories: List[Dict[str, Any]], game_id: str, interval: float) -> float:
+        """
+        Send all category reveals in one message, staggered client-side via reveal_at_ms.
+        
+        Args:
+            categories: Category data in board order
+            game_id: The game to reveal the categories to
+            interval: Seconds between consecutive reveals
+        
+        Returns:
+            Seconds until the last category is revealed on the client
+        """
+        if not self.game_service:
+            return 0.0
+        
+        await self.game_service.connection_manager.broadcast_message(
+            "com.sc2ctl.bighead.reveal_categories_batch",
+            {
+                "categories": [
+                    {"index": i, "category": cat_data, "reveal_at_ms": int(i * interval * 1000)}
+                    for i, cat_data in enumerate(categories)
+                ]
+            },
+            game_id=game_id
+        )
+        return max(len(categories) - 1, 0) * interval
+    
     async def load_default_board(self):
         """Load the default board as a fallback"""
         try:
@@ -162,7 +275,5 @@ class BoardManager:
                 return None
                 
         except Exception as e:
-            logger.error(f"Error loading default board: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error loading default board: {e}")
             return None 
\ No newline at end of file
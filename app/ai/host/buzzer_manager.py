@@ -5,16 +5,40 @@ Buzzer Manager for handling buzzer-related functionality in the Big Head game.
 import logging
 import asyncio
 import os
-import time
-from typing import Set, Optional
+from collections import deque
+from operator import attrgetter
+from typing import Any, Deque, Dict, FrozenSet, Set, Optional, Tuple
+
+from .utils.helpers import run_in_background
 
 logger = logging.getLogger(__name__)
 
+# Shared empty set for calls that take a read-only set of names
+_EMPTY_FROZENSET: FrozenSet[str] = frozenset()
+
+# buzzer_status payload for a deactivated buzzer; shared, so never mutate it
+_INACTIVE_STATUS_PAYLOAD = {"active": False}
+
+# Answer announcement, with the suffix added when someone keeps control of the board
+_REVEAL_BASE = "{prefix} The correct answer was: {answer}."
+_REVEAL_SUFFIX = " {player}, you still have control of the board!"
+
 class BuzzerManager:
     """
     Manages the buzzer state, timeouts, and related functionality.
     Acts as the central authority for buzzer state across the system.
     """
+
+    # Attributes are read on every buzz and audio completion; slots keep those lookups cheap
+    __slots__ = (
+        'last_buzzer', 'buzzer_active', 'incorrect_players', 'expecting_reactivation',
+        '_incorrect_players_frozen', '_active_status_payload',
+        '_processed_audio_ids', '_processed_audio_order', '_last_buzzer_status',
+        'buzzer_timeout_task', 'buzzer_timeout_seconds', 'is_timeout_active', '_buzz_event',
+        'answer_timeout_task', 'answer_timeout_seconds', 'answer_timeout_active', '_answer_done_event',
+        'game_service', 'game_state_manager', 'chat_processor', 'audio_manager', 'game_instance',
+        '_background_tasks',
+    )
     
     def __init__(self):
         """Initialize the buzzer manager."""
@@ -22,17 +46,35 @@ class BuzzerManager:
         self.last_buzzer = None
         self.buzzer_active = False
         self.incorrect_players = set()  # Track players who answered incorrectly
+        # Broadcast-ready snapshots of incorrect_players, rebuilt only by
+        # add_incorrect_player/clear_incorrect_players
+        self._incorrect_players_frozen: FrozenSet[str] = frozenset()
+        self._active_status_payload: Dict[str, Any] = {"active": True, "incorrect_players": []}
         self.expecting_reactivation = False  # Flag to track if we're expecting to reactivate after audio
+
+        # Recently handled audio completions, oldest first, so duplicates are ignored
+        self._processed_audio_ids: Set[str] = set()
+        self._processed_audio_order: Deque[str] = deque(maxlen=100)
+
+
+        # Last buzzer_status sent to clients as (active, incorrect players)
+        self._last_buzzer_status: Optional[Tuple[bool, FrozenSet[str]]] = None
         
-        # Timeout management
+        # Timeout management. Each timeout task waits on its own event, which is set to
+        # stop it early without cancelling the task.
         self.buzzer_timeout_task = None
         self.buzzer_timeout_seconds = 30.0 if os.environ.get("TEST_MODE") else 5.0
         self.is_timeout_active = False
+        self._buzz_event = asyncio.Event()
 
         # Answer timeout management
         self.answer_timeout_task = None
         self.answer_timeout_seconds = 15.0 if os.environ.get("TEST_MODE") else 7.0
         self.answer_timeout_active = False
+        self._answer_done_event = asyncio.Event()
+
+        # Fire-and-forget speech, referenced until it finishes
+        self._background_tasks: Set[asyncio.Task] = set()
         
         # Dependencies (to be set later)
         self.game_service = None
@@ -72,6 +114,54 @@ class BuzzerManager:
             return self.game_instance.last_buzzer
         return None
 
+    def _get_total_player_count(self) -> int:
+        """Get the number of players on the current roster."""
+        if not self.game_state_manager:
+            return 0
+        # Read live: it is only needed once per incorrect answer, and the roster can
+        # change while a clue is open
+        return len(set(self.game_state_manager.get_player_names()))
+
+    def add_incorrect_player(self, player_name: str):
+        """Record a player who answered the current question incorrectly."""
+        if player_name not in self.incorrect_players:
+            self.incorrect_players.add(player_name)
+            self._incorrect_players_frozen = frozenset(self.incorrect_players)
+            self._active_status_payload = {
+                "active": True,
+                "incorrect_players": self._active_status_payload["incorrect_players"] + [player_name],
+            }
+
+    def clear_incorrect_players(self):
+        """Forget the incorrect answers recorded for the current question."""
+        self.incorrect_players.clear()
+        self._incorrect_players_frozen = frozenset()
+        self._active_status_payload = {"active": True, "incorrect_players": []}
+        # Question display and dismiss also flip buzzer_active through GameInstance, which
+        # broadcasts nothing, so the last sent status can no longer be trusted for dedupe
+        self._last_buzzer_status = None
+
+    async def _broadcast_buzzer_status(self, active: bool, game_id: str):
+        """Broadcast the buzzer status, skipping it if clients already have this exact state."""
+        if not self.game_service:
+            return
+
+        incorrect = self._incorrect_players_frozen if active else frozenset()
+        status = (active, incorrect)
+        if status == self._last_buzzer_status:
+            logger.debug(f"Buzzer status unchanged (active={active}), not broadcasting")
+            return
+        self._last_buzzer_status = status
+
+        # Payloads are replaced, never mutated, because broadcast_to_room serializes
+        # them per client across awaits
+        payload = self._active_status_payload if active else _INACTIVE_STATUS_PAYLOAD
+        await self.game_service.connection_manager.broadcast_message(
+            "com.sc2ctl.bighead.buzzer_status",
+            payload,
+            game_id=game_id
+        )
+
     async def activate_buzzer(self, game_id: str):
         """Activate the buzzer and broadcast state to all clients."""
         if not self.buzzer_active:
@@ -90,12 +180,7 @@ class BuzzerManager:
                 self.game_state_manager.buzzer_active = True
 
             # Broadcast status via game service if available
-            if self.game_service:
-                await self.game_service.connection_manager.broadcast_message(
-                    "com.sc2ctl.bighead.buzzer_status",
-                    {"active": True, "incorrect_players": list(self.incorrect_players)},
-                    game_id=game_id
-                )
+            await self._broadcast_buzzer_status(True, game_id)
 
             # Start timeout for buzzer
             self.start_timeout()
@@ -103,27 +188,26 @@ class BuzzerManager:
     async def deactivate_buzzer(self, game_id: str):
         """Deactivate the buzzer and broadcast state to all clients."""
         if self.buzzer_active:
-            logger.debug("Deactivating buzzer")
-            self.buzzer_active = False
+            await self._deactivate_buzzer_impl(game_id)
 
-            # Update game instance state if available
-            if self.game_instance:
-                self.game_instance.buzzer_active = False
+    async def _deactivate_buzzer_impl(self, game_id: str):
+        """Deactivate the buzzer without checking that it is active first."""
+        logger.debug("Deactivating buzzer")
+        self.buzzer_active = False
 
-            # Update game state manager if available
-            if self.game_state_manager:
-                self.game_state_manager.buzzer_active = False
+        # Update game instance state if available
+        if self.game_instance:
+            self.game_instance.buzzer_active = False
 
-            # Broadcast status via game service if available
-            if self.game_service:
-                await self.game_service.connection_manager.broadcast_message(
-                    "com.sc2ctl.bighead.buzzer_status",
-                    {"active": False},
-                    game_id=game_id
-                )
-
-            # Cancel any active timeout
-            self.cancel_timeout()
+        # Update game state manager if available
+        if self.game_state_manager:
+            self.game_state_manager.buzzer_active = False
+
+        # Broadcast status via game service if available
+        await self._broadcast_buzzer_status(False, game_id)
+
+        # Cancel any active timeout
+        self.cancel_timeout()
     
     async def handle_question_display(self):
         """Handle when a question is displayed, making sure buzzer is disabled."""
@@ -131,7 +215,7 @@ class BuzzerManager:
         await self.deactivate_buzzer(game_id=self._get_game_id())
 
         # Reset state for new question
-        self.incorrect_players.clear()
+        self.clear_incorrect_players()
         self.last_buzzer = None
         self.cancel_answer_timeout()  # Cancel any active answer timeout
     
@@ -145,21 +229,28 @@ class BuzzerManager:
         try:
             logger.debug(f"Audio completed notification: {audio_id}")
 
+            # Nothing below awaits before these are used, so read them once
+            game_id = self._get_game_id()
+            current_question = self._get_current_question()
+            last_buzzer = self._get_last_buzzer()
+
+            # Outside a question (intros, score announcements) only a pending
+            # reactivation or an incorrect-answer audio can matter
+            if current_question is None and not self.expecting_reactivation and "incorrect" not in audio_id:
+                logger.debug(f"No active question, ignoring audio completion for {audio_id}")
+                return
+
             # Track already processed audio IDs to prevent duplicate handling
-            if hasattr(self, '_processed_audio_ids'):
-                if audio_id in self._processed_audio_ids:
-                    logger.debug(f"Already processed audio completion for {audio_id}, skipping")
-                    return
-                self._processed_audio_ids.add(audio_id)
-            else:
-                # Initialize the set on first call
-                self._processed_audio_ids = {audio_id}
-                
-            # Limit the size of the set to prevent memory leaks
-            if len(self._processed_audio_ids) > 100:
-                # Keep only the most recent 50 IDs
-                self._processed_audio_ids = set(list(self._processed_audio_ids)[-50:])
-            
+            if audio_id in self._processed_audio_ids:
+                logger.debug(f"Already processed audio completion for {audio_id}, skipping")
+                return
+
+            # Remember only the most recent IDs; the deque drops the oldest on append
+            if len(self._processed_audio_order) == self._processed_audio_order.maxlen:
+                self._processed_audio_ids.discard(self._processed_audio_order[0])
+            self._processed_audio_order.append(audio_id)
+            self._processed_audio_ids.add(audio_id)
+
             # Check and clear audio IDs, and determine what type of audio completed
             was_question_audio = False
             was_incorrect_audio = False
@@ -175,92 +266,49 @@ class BuzzerManager:
                 self.expecting_reactivation = False
 
                 # Check if we still have a current question and other players available
-                current_question = self._get_current_question()
                 if current_question:
-                    # Get all players and incorrect players
-                    all_players = set()
-                    if self.game_state_manager:
-                        all_players = set(self.game_state_manager.get_player_names())
+                    total_players = self._get_total_player_count()
                     
-                    if len(self.incorrect_players) < len(all_players):
+                    if len(self.incorrect_players) < total_players:
                         logger.debug(f"Not all players have attempted, reactivating buzzer. "
-                                     f"Incorrect: {len(self.incorrect_players)}, Total: {len(all_players)}")
+                                     f"Incorrect: {len(self.incorrect_players)}, Total: {total_players}")
 
                         # Activate the buzzer for other players
-                        await self.activate_buzzer(game_id=self._get_game_id())
-
-                        # Update game state manager buzzer state
-                        if self.game_state_manager:
-                            self.game_state_manager.buzzer_active = True
+                        await self.activate_buzzer(game_id=game_id)
                     else:
                         # All players have attempted, dismiss the question
                         logger.debug("All players have attempted, dismissing question")
 
                         # Capture the correct answer before dismiss clears it
                         correct_answer = current_question.get("answer", "Unknown") if current_question else "Unknown"
-
-                        if self.game_service:
-                            await self.game_service.dismiss_question(game_id=self._get_game_id())
-
-                            # Restore board control
-                            controlling_player = None
-                            if self.game_state_manager:
-                                controlling_player = self.game_state_manager.get_player_with_control()
-                                if controlling_player:
-                                    await self.game_service.connection_manager.broadcast_message(
-                                        "com.sc2ctl.bighead.select_question",
-                                        {"contestant": controlling_player},
-                                        game_id=self._get_game_id()
-                                    )
-
-                            # Announce the correct answer
-                            if controlling_player:
-                                reveal_msg = f"Nobody got it! The correct answer was: {correct_answer}. {controlling_player}, you still have control of the board!"
-                            else:
-                                reveal_msg = f"Nobody got it! The correct answer was: {correct_answer}."
-
-                            if self.chat_processor:
-                                await self.chat_processor.send_chat_message(reveal_msg)
-                            if self.audio_manager:
-                                asyncio.create_task(self.audio_manager.synthesize_and_stream_speech(reveal_msg))
+                        await self._reveal_and_restore_control(correct_answer)
 
                 return
 
             # Check if we're expecting to reactivate the buzzer after regular audio
-            elif self.expecting_reactivation and self._get_current_question():
+            elif self.expecting_reactivation and current_question:
                 logger.debug("Regular audio completed with reactivation flag set, activating buzzer")
 
                 # Reset flag
                 self.expecting_reactivation = False
 
                 # Activate the buzzer for other players
-                await self.activate_buzzer(game_id=self._get_game_id())
-
-                # Update game state manager buzzer state
-                if self.game_state_manager:
-                    self.game_state_manager.buzzer_active = True
+                await self.activate_buzzer(game_id=game_id)
 
                 return
 
             # Normal case: Only activate buzzer if this was the QUESTION audio,
             # there's a current question, and no one has buzzed yet
-            current_question = self._get_current_question()
-            last_buzzer = self._get_last_buzzer()
-
             if was_question_audio and current_question and not last_buzzer:
                 logger.debug("Question audio completed, activating buzzer")
 
                 # Clear any existing incorrect player tracking
-                self.incorrect_players.clear()
+                self.clear_incorrect_players()
                 if self.game_state_manager:
                     self.game_state_manager.clear_incorrect_attempts()
 
                 # Activate the buzzer
-                await self.activate_buzzer(game_id=self._get_game_id())
-
-                # Update game state manager buzzer state
-                if self.game_state_manager:
-                    self.game_state_manager.buzzer_active = True
+                await self.activate_buzzer(game_id=game_id)
             elif was_question_audio and current_question and last_buzzer and current_question.get("double_big_head", False):
                 # Double Big Head: player already has the buzzer, start answer timer
                 logger.debug(f"Double Big Head audio completed, starting answer timer for {last_buzzer}")
@@ -269,7 +317,7 @@ class BuzzerManager:
                     await self.game_service.connection_manager.broadcast_message(
                         "com.sc2ctl.bighead.answer_timer_start",
                         {"player": last_buzzer, "seconds": self.answer_timeout_seconds},
-                        game_id=self._get_game_id()
+                        game_id=game_id
                     )
             else:
                 if not was_question_audio:
@@ -282,15 +330,14 @@ class BuzzerManager:
                     logger.debug("Not activating buzzer - unknown reason")
                 
         except Exception as e:
-            logger.error(f"Error handling audio completion: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error handling audio completion: {e}")
     
     async def handle_player_buzz(self, player_name: str, game_id: str):
         """Handle when a player buzzes in."""
         logger.info(f"Player {player_name} buzzed in")
+        game_id = game_id or self._get_game_id()
 
-        # CRITICAL: Set last_buzzer and cancel timeout SYNCHRONOUSLY before any
+        # CRITICAL: Set last_buzzer and stop the timeout SYNCHRONOUSLY before any
         # await.  During an await the event loop may resume the buzzer-timeout
         # task; if game_instance.last_buzzer is still None at that point, the
         # timeout handler will dismiss the question out from under the player.
@@ -299,14 +346,14 @@ class BuzzerManager:
         if self.game_instance:
             self.game_instance.last_buzzer = player_name
 
-        # Now safe to await — the timeout task is cancelled and last_buzzer is
-        # visible to any code that checks it.
-        await self.deactivate_buzzer(game_id=self._get_game_id())
+        # Now safe to await — the timeout task has been told to stop and last_buzzer
+        # is visible to any code that checks it. GameService only accepts a buzz while
+        # the buzzer is active, so skip the guard in deactivate_buzzer.
+        await self._deactivate_buzzer_impl(game_id)
 
         # Update game state manager
         if self.game_state_manager:
             self.game_state_manager.set_buzzed_player(player_name, self.incorrect_players)
-            self.game_state_manager.buzzer_active = False
 
         # Start answer timeout and notify frontend
         if self.game_instance:
@@ -314,7 +361,7 @@ class BuzzerManager:
             await self.game_service.connection_manager.broadcast_message(
                 "com.sc2ctl.bighead.answer_timer_start",
                 {"player": player_name, "seconds": self.answer_timeout_seconds},
-                game_id=game_id if game_id else self._get_game_id()
+                game_id=game_id
             )
     
     async def handle_incorrect_answer(self, player_name: str):
@@ -325,7 +372,7 @@ class BuzzerManager:
         self.cancel_answer_timeout()
         
         # Add player to the set of incorrect players
-        self.incorrect_players.add(player_name)
+        self.add_incorrect_player(player_name)
         
         # Track incorrect attempt in game state
         if self.game_state_manager:
@@ -341,54 +388,86 @@ class BuzzerManager:
         
         # Check if all players have attempted (this logic still needed for edge cases)
         if self.game_state_manager:
-            all_players = set(self.game_state_manager.get_player_names())
-            incorrect_players = self.incorrect_players
-            
             current_question = self._get_current_question()
             is_double_big_head = current_question.get("double_big_head", False) if current_question else False
 
-            if len(incorrect_players) >= len(all_players) or is_double_big_head:
+            if len(self.incorrect_players) >= self._get_total_player_count() or is_double_big_head:
                 # All players have attempted (or daily double — only one player answers), dismiss
                 logger.debug("All players have attempted, dismissing question")
                 self.expecting_reactivation = False  # Cancel reactivation expectation
 
                 # Capture the correct answer BEFORE dismiss clears the question
-                current_question = self._get_current_question()
                 correct_answer = current_question.get("answer", "Unknown") if current_question else "Unknown"
 
                 # Reset game_state_manager
                 if self.game_state_manager:
                     self.game_state_manager.reset_question()
 
-                if self.game_service:
-                    await self.game_service.dismiss_question(game_id=self._get_game_id())
-
-                    # Restore board control for the controlling player
-                    controlling_player = None
-                    if self.game_state_manager:
-                        controlling_player = self.game_state_manager.get_player_with_control()
-                        if controlling_player:
-                            await self.game_service.connection_manager.broadcast_message(
-                                "com.sc2ctl.bighead.select_question",
-                                {"contestant": controlling_player},
-                                game_id=self._get_game_id()
-                            )
-
-                    # Announce the correct answer
-                    if controlling_player:
-                        reveal_msg = f"Nobody got it! The correct answer was: {correct_answer}. {controlling_player}, you still have control of the board!"
-                    else:
-                        reveal_msg = f"Nobody got it! The correct answer was: {correct_answer}."
-
-                    if self.chat_processor:
-                        await self.chat_processor.send_chat_message(reveal_msg)
-                    if self.audio_manager:
-                        asyncio.create_task(self.audio_manager.synthesize_and_stream_speech(reveal_msg))
+                await self._reveal_and_restore_control(correct_answer)
         else:
             # No game state manager, just reactivate the buzzer
             logger.warning("No game state manager available, just reactivating buzzer")
             await self.activate_buzzer(game_id=self._get_game_id())
 
+    async def _reveal_and_restore_control(self, correct_answer: str, prefix: str = "Nobody got it!",
+                                          fallback_to_leader: bool = False):
+        """
+        Dismiss the current question, hand the board back and announce the answer.
+        
+        Args:
+            correct_answer: The answer to reveal
+            prefix: Opening line of the announcement
+            fallback_to_leader: Give control to the highest scorer if nobody has it
+        """
+        game_id = self._get_game_id()
+        
+        # Dismiss the question in the UI immediately (before TTS)
+        if self.game_service:
+            await self.game_service.dismiss_question(game_id=game_id)
+        
+        # Restore board control for the controlling player
+        controlling_player = None
+        if self.game_state_manager:
+            controlling_player = self.game_state_manager.get_player_with_control()
+            if not controlling_player and fallback_to_leader:
+                # If no player has control, find the player with the highest score
+                if self.game_instance and self.game_instance.state:
+                    leader = max(self.game_instance.state.contestants.values(),
+                                 key=attrgetter('score'), default=None)
+
+                    if leader is not None:
+                        self.game_state_manager.set_player_with_control(leader.name, _EMPTY_FROZENSET)
+                        controlling_player = leader.name
+                    else:
+                        logger.warning("No player found with highest score to give control to")
+        else:
+            logger.warning("No game state manager available, cannot determine controlling player")
+        
+        # Announce the correct answer (after dismiss so modal closes immediately)
+        reveal_msg = _REVEAL_BASE.format(prefix=prefix, answer=correct_answer)
+        if controlling_player:
+            reveal_msg += _REVEAL_SUFFIX.format(player=controlling_player)
+        logger.debug(f"Revealing answer: {reveal_msg}")
+        
+        # Start synthesis first; it holds the audio stream lock, so it stays in the background
+        if self.audio_manager:
+            run_in_background(self.audio_manager.synthesize_and_stream_speech(reveal_msg),
+                              self._background_tasks, "answer reveal speech")
+        
+        # The board handoff and the chat announcement are independent, send them together
+        sends = []
+        if controlling_player and self.game_service:
+            sends.append(self.game_service.connection_manager.broadcast_message(
+                "com.sc2ctl.bighead.select_question",
+                {"contestant": controlling_player},
+                game_id=game_id
+            ))
+        if self.chat_processor:
+            sends.append(self.chat_processor.send_chat_message(reveal_msg))
+        for result in await asyncio.gather(*sends, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.error(f"Error announcing answer reveal: {result}")
+    
     async def handle_correct_answer(self, player_name: str):
         """Handle when a player gives a correct answer."""
         logger.info(f"Correct answer from {player_name}")
@@ -419,22 +498,19 @@ class BuzzerManager:
         # Cancel any existing timeout task first
         self.cancel_timeout()
         
-        # Create new timeout task and set flag
-        expiry_time = time.time() + self.buzzer_timeout_seconds
+        # Create new timeout task and set flag; a fresh event so stopping an old
+        # task can never leak into this one
         logger.debug(f"Starting buzzer timeout task ({self.buzzer_timeout_seconds}s)")
         
-        self.buzzer_timeout_task = asyncio.create_task(self.handle_timeout())
+        self._buzz_event = asyncio.Event()
+        self.buzzer_timeout_task = asyncio.create_task(self.handle_timeout(self._buzz_event))
         self.is_timeout_active = True
     
     def cancel_timeout(self):
-        """Cancel the buzzer timeout task if it exists."""
-        if self.buzzer_timeout_task:
-            if not self.buzzer_timeout_task.done():
-                logger.debug("Cancelling active buzzer timeout task")
-                self.buzzer_timeout_task.cancel()
-            else:
-                logger.debug("Buzzer timeout task already done, clearing reference")
-            
+        """Stop the buzzer timeout task if it exists."""
+        if self.buzzer_timeout_task is not None:
+            # Setting the event is harmless if the task has already finished
+            self._buzz_event.set()
             self.buzzer_timeout_task = None
             self.is_timeout_active = False
     
@@ -443,32 +519,41 @@ class BuzzerManager:
         # Cancel any existing answer timeout task first
         self.cancel_answer_timeout()
         
-        # Create new timeout task and set flag
-        expiry_time = time.time() + self.answer_timeout_seconds
+        # Create new timeout task and set flag; a fresh event so stopping an old
+        # task can never leak into this one
         logger.debug(f"Starting answer timeout task for {player_name} ({self.answer_timeout_seconds}s)")
         
-        self.answer_timeout_task = asyncio.create_task(self.handle_answer_timeout(player_name))
+        self._answer_done_event = asyncio.Event()
+        self.answer_timeout_task = asyncio.create_task(
+            self.handle_answer_timeout(player_name, self._answer_done_event)
+        )
         self.answer_timeout_active = True
     
     def cancel_answer_timeout(self):
-        """Cancel the answer timeout task if it exists."""
-        if self.answer_timeout_task:
-            if not self.answer_timeout_task.done():
-                logger.debug("Cancelling active answer timeout task")
-                self.answer_timeout_task.cancel()
-            else:
-                logger.debug("Answer timeout task already done, clearing reference")
-            
+        """Stop the answer timeout task if it exists."""
+        if self.answer_timeout_task is not None:
+            # Setting the event is harmless if the task has already finished
+            self._answer_done_event.set()
             self.answer_timeout_task = None
             self.answer_timeout_active = False
     
-    async def handle_timeout(self):
-        """Handle the case when buzzer timeout expires with no one answering."""
+    async def handle_timeout(self, stop_event: asyncio.Event):
+        """
+        Handle the case when buzzer timeout expires with no one answering.
+        
+        Args:
+            stop_event: Set to end the wait early (e.g. a player buzzed in)
+        """
         try:
             logger.debug(f"Buzzer timeout starting - waiting {self.buzzer_timeout_seconds}s...")
             
-            # Wait for the timeout period
-            await asyncio.sleep(self.buzzer_timeout_seconds)
+            # Wait for the timeout period unless we're told to stop first
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=self.buzzer_timeout_seconds)
+                logger.debug("Buzzer timeout stopped before expiry")
+                return
+            except asyncio.TimeoutError:
+                pass
             
             logger.debug("Buzzer timeout expired - checking if we need to handle it...")
 
@@ -485,58 +570,9 @@ class BuzzerManager:
                     logger.warning("No question found during buzzer timeout")
                     return
                 
+                # Reveal the answer; if nobody has control yet, the leader gets it
                 answer = question.get("answer", "Unknown")
-                
-                # Announce that time is up and reveal the answer
-                # GET player with control
-                if self.game_state_manager:
-                    controlling_player = self.game_state_manager.get_player_with_control()
-                    if controlling_player:
-                        timeout_msg = f"Time's up! The correct answer was: {answer}. {controlling_player}, you still have control of the board!"
-                    else:
-                        timeout_msg = f"Time's up! The correct answer was: {answer}"
-                logger.debug(f"Revealing answer: {timeout_msg}")
-
-                # Dismiss the question in the UI immediately (before TTS)
-                if self.game_service:
-                    logger.debug("Dismissing question after timeout")
-                    await self.game_service.dismiss_question(game_id=self._get_game_id())
-
-                # Restore board control for the controlling player
-                if self.game_state_manager:
-                    controlling_player = self.game_state_manager.get_player_with_control()
-                    if not controlling_player:
-                        # If no player has control, find the player with the highest score
-                        if self.game_instance and self.game_instance.state:
-                            best_player = None
-                            best_score = float('-inf')
-
-                            for contestant_id, contestant in self.game_instance.state.contestants.items():
-                                if contestant.score > best_score:
-                                    best_score = contestant.score
-                                    best_player = contestant.name
-
-                            if best_player:
-                                self.game_state_manager.set_player_with_control(best_player, set())
-                                controlling_player = best_player
-                            else:
-                                logger.warning("No player found with highest score after buzzer timeout")
-
-                    if controlling_player and self.game_service:
-                        await self.game_service.connection_manager.broadcast_message(
-                            "com.sc2ctl.bighead.select_question",
-                            {"contestant": controlling_player},
-                            game_id=self._get_game_id()
-                        )
-                else:
-                    logger.warning("No game state manager available during timeout, cannot determine controlling player")
-
-                # Send message and speak it (after dismiss so modal closes immediately)
-                if self.chat_processor:
-                    await self.chat_processor.send_chat_message(timeout_msg)
-
-                if self.audio_manager:
-                    asyncio.create_task(self.audio_manager.synthesize_and_stream_speech(timeout_msg))
+                await self._reveal_and_restore_control(answer, prefix="Time's up!", fallback_to_leader=True)
             else:
                 logger.debug("Buzzer timeout not handled - no active question or someone already buzzed in")
                 
@@ -544,17 +580,26 @@ class BuzzerManager:
             # Task was cancelled, which is expected behavior
             logger.debug("Buzzer timeout task was cancelled")
         except Exception as e:
-            logger.error(f"Error in buzzer timeout handler: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error in buzzer timeout handler: {e}")
     
-    async def handle_answer_timeout(self, player_name: str):
-        """Handle the case when a player doesn't answer within the time limit."""
+    async def handle_answer_timeout(self, player_name: str, stop_event: asyncio.Event):
+        """
+        Handle the case when a player doesn't answer within the time limit.
+        
+        Args:
+            player_name: The player who holds the buzzer
+            stop_event: Set to end the wait early (e.g. the player answered)
+        """
         try:
             logger.debug(f"Answer timeout starting for {player_name} - waiting {self.answer_timeout_seconds}s...")
             
-            # Wait for the timeout period
-            await asyncio.sleep(self.answer_timeout_seconds)
+            # Wait for the timeout period unless we're told to stop first
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=self.answer_timeout_seconds)
+                logger.debug(f"Answer timeout for {player_name} stopped before expiry")
+                return
+            except asyncio.TimeoutError:
+                pass
             
             logger.debug(f"Answer timeout expired for {player_name} - checking if we need to handle it...")
 
@@ -598,11 +643,14 @@ class BuzzerManager:
                 await self.handle_incorrect_answer(player_name)
 
                 # Send chat message and TTS after UI is already updated
+                announcements = []
                 if self.chat_processor:
-                    await self.chat_processor.send_chat_message(timeout_msg)
-
+                    announcements.append(self.chat_processor.send_chat_message(timeout_msg))
                 if self.audio_manager:
-                    await self.audio_manager.synthesize_and_stream_speech(timeout_msg)
+                    announcements.append(self.audio_manager.synthesize_and_stream_speech(timeout_msg))
+                for result in await asyncio.gather(*announcements, return_exceptions=True):
+                    if isinstance(result, Exception):
+                        logger.error(f"Error announcing answer timeout: {result}")
                 
             else:
                 logger.debug(f"Answer timeout not handled - no active question, or player {player_name} no longer has control")
@@ -611,6 +659,4 @@ class BuzzerManager:
             # Task was cancelled, which is expected behavior
             logger.debug(f"Answer timeout task for {player_name} was cancelled")
         except Exception as e:
-            logger.error(f"Error in answer timeout handler: {e}")
-            import traceback
-            logger.error(traceback.format_exc()) 
\ No newline at end of file
+            logger.exception(f"Error in answer timeout handler: {e}")
\ No newline at end of file
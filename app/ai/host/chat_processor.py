@@ -6,13 +6,16 @@ import logging
 import asyncio
 import os
 import re
-from typing import Optional, Set, Dict, Any
-from datetime import datetime
+import time
+from typing import Optional, List, Set, Dict, Any
 
-from .utils.helpers import is_same_player
+from .utils.helpers import is_same_player, run_in_background
 
 logger = logging.getLogger(__name__)
 
+# TEST_MODE is fixed for the life of the process (main loads .env before importing us)
+_TEST_MODE = bool(os.environ.get("TEST_MODE"))
+
 class ChatProcessor:
     """
     Processes chat messages for the AI host.
@@ -21,6 +24,11 @@ class ChatProcessor:
     to determine appropriate host responses.
     """
 
+    __slots__ = (
+        'host_name', 'game_service', 'game_state_manager', 'answer_evaluator', 'game_instance',
+        'audio_manager', 'buzzer_manager', '_game_id', '_background_tasks',
+    )
+
     def __init__(self):
         """Initialize the chat processor."""
         self.host_name = None
@@ -28,43 +36,104 @@ class ChatProcessor:
         self.game_state_manager = None
         self.answer_evaluator = None
         self.game_instance = None
+        self.audio_manager = None
+        self.buzzer_manager = None
+        self._game_id = None
+        # Fire-and-forget sends, referenced here so they are not garbage collected mid-flight
+        self._background_tasks: Set[asyncio.Task] = set()
 
     def set_host_name(self, name: str):
         """Set the host name for chat messages."""
         self.host_name = name
 
-    def set_dependencies(self, game_service, game_state_manager, answer_evaluator, game_instance=None):
+    def set_dependencies(self, game_service, game_state_manager, answer_evaluator, game_instance=None,
+                         audio_manager=None, buzzer_manager=None):
         """Set dependencies required for chat processing."""
         self.game_service = game_service
         self.game_state_manager = game_state_manager
         self.answer_evaluator = answer_evaluator
         self.game_instance = game_instance
+        if audio_manager:
+            self.audio_manager = audio_manager
+        if buzzer_manager:
+            self.buzzer_manager = buzzer_manager
+        # A game instance keeps its id for life, so read it once
+        self._game_id = game_instance.game_id if game_instance else None
+
+    def _send_in_background(self, coro, description: str):
+        """
+        Run a send or speech without waiting for it, logging any failure.
+
+        Args:
+            coro: The coroutine to run
+            description: What is being sent, for the error log
+        """
+        run_in_background(coro, self._background_tasks, description)
+
+    def _chat_payload(self, message: str) -> Dict[str, Any]:
+        """Build the chat_message payload for a message from the host."""
+        return {
+            "username": self.host_name,
+            "message": message,
+            "isHost": True,
+            # Epoch milliseconds; the frontend passes this straight to new Date()
+            "timestamp": int(time.time() * 1000),
+            "is_admin": True
+        }
+
+    async def send_chat_messages(self, messages: List[str], await_send: bool = True):
+        """
+        Send several chat messages as the AI host in a single broadcast pass.
+
+        Args:
+            messages: The message texts, in the order they should appear
+            await_send: Wait for the broadcast to finish (see send_chat_message)
+        """
+        if not self.game_service:
+            logger.error("Cannot send chat messages: Game service not set")
+            return False
+
+        try:
+            broadcast = self.game_service.connection_manager.broadcast_batch(
+                self._game_id,
+                [("com.sc2ctl.bighead.chat_message", self._chat_payload(message)) for message in messages]
+            )
+            if await_send:
+                await broadcast
+            else:
+                self._send_in_background(broadcast, "chat messages")
 
-    @property
-    def _game_id(self):
-        """Get the game_id from the game instance."""
-        return self.game_instance.game_id
+            for message in messages:
+                logger.info(f"AI host ({self.host_name}) sent message: {message}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error sending chat messages: {e}")
+            return False
+
+    async def send_chat_message(self, message: str, await_send: bool = True):
+        """
+        Send a chat message as the AI host.
 
-    async def send_chat_message(self, message: str):
-        """Send a chat message as the AI host."""
+        Args:
+            message: The message text
+            await_send: Wait for the broadcast to finish; when False it is sent in the
+                background and True is returned once it is scheduled
+        """
         if not self.game_service:
             logger.error("Cannot send chat message: Game service not set")
             return False
 
         try:
-            chat_payload = {
-                "username": self.host_name,
-                "message": message,
-                "isHost": True,
-                "timestamp": datetime.now().isoformat(),
-                "is_admin": True
-            }
-
-            await self.game_service.connection_manager.broadcast_message(
+            broadcast = self.game_service.connection_manager.broadcast_message(
                 "com.sc2ctl.bighead.chat_message",
-                chat_payload,
+                self._chat_payload(message),
                 game_id=self._game_id
             )
+            if await_send:
+                await broadcast
+            else:
+                self._send_in_background(broadcast, "chat message")
 
             logger.info(f"AI host ({self.host_name}) sent message: {message}")
             return True
@@ -73,6 +142,33 @@ class ChatProcessor:
             logger.error(f"Error sending chat message: {e}")
             return False
 
+    async def _play_correct_sequence(self, audio_mgr, correct_msg: str, control_msg: str):
+        """
+        Speak the correct-answer verdict, then the board control announcement.
+
+        Args:
+            audio_mgr: The host's audio manager
+            correct_msg: The verdict to speak first
+            control_msg: The board control announcement
+        """
+        await audio_mgr.synthesize_and_stream_speech(correct_msg)
+        await audio_mgr.synthesize_and_stream_speech(control_msg)
+
+    async def _play_incorrect_speech(self, audio_mgr, incorrect_msg: str):
+        """
+        Speak the incorrect-answer verdict, tagged so its completion reactivates the buzzer.
+
+        Args:
+            audio_mgr: The host's audio manager
+            incorrect_msg: The verdict to speak
+        """
+        try:
+            await audio_mgr.synthesize_and_stream_speech(incorrect_msg, is_incorrect_answer_audio=True)
+        except TypeError as e:
+            logger.error(f"Error synthesizing incorrect answer speech: {e}")
+            logger.info("Falling back to regular speech synthesis without incorrect answer flag")
+            await audio_mgr.synthesize_and_stream_speech(incorrect_msg)
+
     async def process_chat_message(self, username: str, message: str):
         """
         Process a chat message from a player.
@@ -81,27 +177,33 @@ class ChatProcessor:
             username: The player's username
             message: The content of the chat message
         """
-        logger.debug(f"Processing chat message from {username}: {message}")
-
-        # Skip processing messages from the host itself
-        if is_same_player(username, self.host_name):
+        # Skip processing messages from the host itself; an exact match skips the fuzzy comparison
+        if username == self.host_name or is_same_player(username, self.host_name):
             logger.debug(f"Skipping host message: {message}")
             return
 
-        # Check if we're in the preference collection phase
+        # Preference collection just records every message, so take it before anything else
         if self.game_state_manager.is_waiting_for_preferences():
-            logger.debug(f"Adding message from {username} to preference collection")
             self.game_state_manager.add_chat_message(username, message)
             return
 
-        # Log detailed game state for debugging
+        logger.debug(f"Processing chat message from {username}: {message}")
+
         buzzed_player = self.game_state_manager.get_buzzed_player()
-        controlling_player = self.game_state_manager.get_player_with_control()
 
-        logger.debug(f"Game state - buzzed_player: {buzzed_player}, controlling_player: {controlling_player}")
-        logger.debug(f"Current question in game state: {self.game_state_manager.game_state.current_question is not None}")
-        logger.debug(f"Game instance - current_question: {self.game_instance.current_question is not None}")
-        logger.debug(f"Game instance - last_buzzer: {self.game_instance.last_buzzer}")
+        # Log detailed game state for debugging; skipped entirely above DEBUG
+        if logger.isEnabledFor(logging.DEBUG):
+            controlling_player = self.game_state_manager.get_player_with_control()
+            logger.debug(f"Game state - buzzed_player: {buzzed_player}, controlling_player: {controlling_player}")
+            logger.debug(f"Current question in game state: {self.game_state_manager.game_state.current_question is not None}")
+            logger.debug(f"Game instance - current_question: {self.game_instance.current_question is not None}")
+            logger.debug(f"Game instance - last_buzzer: {self.game_instance.last_buzzer}")
+
+        # Most chat happens while nobody has buzzed in; only the buzzed player's
+        # messages can be answers, so check that before looking at the question state
+        if not buzzed_player or (username != buzzed_player and not is_same_player(username, buzzed_player)):
+            logger.debug(f"Message not processed for action: {username}: {message}")
+            return
 
         # Determine if there's currently an active question
         has_active_question = (
@@ -111,8 +213,7 @@ class ChatProcessor:
 
         logger.debug(f"Final active question determination: {has_active_question}")
 
-        # Check if this player has buzzed in and if there's an active question
-        if has_active_question and buzzed_player and is_same_player(username, buzzed_player):
+        if has_active_question:
             logger.debug(f"Processing as answer from buzzed player: {username}")
             await self.process_player_answer(username, message)
             return
@@ -132,17 +233,20 @@ class ChatProcessor:
         try:
             # Cancel the answer timeout immediately — the player has submitted an answer,
             # so we must not let the timeout fire while the AI evaluates it.
-            if (self.game_instance and self.game_instance.ai_host
-                    and self.game_instance.ai_host.buzzer_manager):
-                self.game_instance.ai_host.buzzer_manager.cancel_answer_timeout()
+            if self.buzzer_manager:
+                self.buzzer_manager.cancel_answer_timeout()
                 logger.debug("Cancelled answer timeout — player submitted answer")
 
-            # Notify frontend to stop the answer timer visual
+            # Notify frontend to stop the answer timer visual; nothing below depends on
+            # it, so let it go out while the answer is evaluated
             if self.game_service:
-                await self.game_service.connection_manager.broadcast_message(
-                    "com.sc2ctl.bighead.answer_timer_stop",
-                    {},
-                    game_id=self._game_id
+                self._send_in_background(
+                    self.game_service.connection_manager.broadcast_message(
+                        "com.sc2ctl.bighead.answer_timer_stop",
+                        {},
+                        game_id=self._game_id
+                    ),
+                    "answer timer stop"
                 )
 
             # Get the current question
@@ -169,18 +273,21 @@ class ChatProcessor:
             explanation = evaluation_result.get("explanation", "")
 
             # Send appropriate response based on correctness
-            test_mode = os.environ.get("TEST_MODE")
+            test_mode = _TEST_MODE
 
             if is_correct:
                 correct_msg = f"That's correct, {username}! {explanation}"
+                control_msg = f"{username}, you have control of the board!"
                 logger.info(f"Player {username} answered correctly")
-                await self.send_chat_message(correct_msg)
 
                 # Update scores and dismiss question BEFORE TTS (which blocks until audio_complete)
                 logger.debug(f"Notifying game service about answer: player={username}, correct=True, game_id={self._game_id}")
                 await self.game_service.answer_question(True, username, game_id=self._game_id)
-                logger.debug("Explicitly dismissing question after correct answer")
-                await self.game_service.dismiss_question(game_id=self._game_id)
+                # answer_question already dismisses Double Big Heads and the last clue on the
+                # board; a second dismiss would rebroadcast it and complete the game twice
+                if self.game_instance.current_question is not None:
+                    logger.debug("Explicitly dismissing question after correct answer")
+                    await self.game_service.dismiss_question(game_id=self._game_id)
 
                 self.game_state_manager.reset_buzzed_player()
                 logger.debug(f"Reset buzzed player state after correct answer from {username}")
@@ -188,25 +295,21 @@ class ChatProcessor:
                 self.game_state_manager.set_player_with_control(username, set())
                 logger.debug(f"Player {username} gets control of the board")
 
+                # Verdict and board control go out together once the question is closed
+                await self.send_chat_messages([correct_msg, control_msg], await_send=False)
+
                 # Fire-and-forget TTS for correct answer + board control messages.
                 # The _stream_lock serializes playback, but we don't block the game flow.
-                if not test_mode and self.game_instance and self.game_instance.ai_host and hasattr(self.game_instance.ai_host, "audio_manager"):
-                    audio_mgr = self.game_instance.ai_host.audio_manager
-
-                    async def _play_correct_sequence():
-                        await audio_mgr.synthesize_and_stream_speech(correct_msg)
-                        await self.send_chat_message(f"{username}, you have control of the board!")
-                        await audio_mgr.synthesize_and_stream_speech(f"{username}, you have control of the board!")
-
-                    asyncio.create_task(_play_correct_sequence())
-                else:
-                    await asyncio.sleep(0.5)
-                    await self.send_chat_message(f"{username}, you have control of the board!")
+                if not test_mode and self.audio_manager:
+                    self._send_in_background(
+                        self._play_correct_sequence(self.audio_manager, correct_msg, control_msg),
+                        "correct answer speech"
+                    )
 
             else:
                 incorrect_msg = f"I'm sorry, {username}, that's incorrect. {explanation}"
                 logger.info(f"Player {username} answered incorrectly")
-                await self.send_chat_message(incorrect_msg)
+                await self.send_chat_message(incorrect_msg, await_send=False)
 
                 # Update scores BEFORE TTS (which blocks until audio_complete)
                 logger.debug(f"Notifying game service about answer: player={username}, correct=False, game_id={self._game_id}")
@@ -223,31 +326,26 @@ class ChatProcessor:
                     if test_mode:
                         # TEST_MODE: directly reactivate buzzer instead of waiting for audio
                         logger.info("TEST_MODE: Directly reactivating buzzer after incorrect answer")
-                        if self.game_instance and self.game_instance.ai_host and self.game_instance.ai_host.buzzer_manager:
-                            bm = self.game_instance.ai_host.buzzer_manager
-                            bm.expecting_reactivation = False
-                            await bm.activate_buzzer(game_id=self._game_id)
+                        if self.buzzer_manager:
+                            self.buzzer_manager.expecting_reactivation = False
+                            await self.buzzer_manager.activate_buzzer(game_id=self._game_id)
                     else:
                         logger.debug("Will reactivate buzzer AFTER incorrect answer audio plays")
-                        if self.game_instance and self.game_instance.ai_host and self.game_instance.ai_host.buzzer_manager:
-                            self.game_instance.ai_host.buzzer_manager.expecting_reactivation = True
+                        if self.buzzer_manager:
+                            self.buzzer_manager.expecting_reactivation = True
                             logger.debug("Setting buzzer_manager.expecting_reactivation = True")
 
-                # TTS blocks until frontend sends audio_complete.
-                # Skip if the question was already dismissed (all players wrong) —
-                # buzzer_manager.handle_incorrect_answer already did TTS for "Nobody got it".
-                if self.game_instance.current_question and not test_mode and self.game_instance.ai_host and hasattr(self.game_instance.ai_host, "audio_manager"):
-                    try:
-                        await self.game_instance.ai_host.audio_manager.synthesize_and_stream_speech(incorrect_msg, is_incorrect_answer_audio=True)
-                    except TypeError as e:
-                        logger.error(f"Error synthesizing incorrect answer speech: {e}")
-                        logger.info("Falling back to regular speech synthesis without incorrect answer flag")
-                        await self.game_instance.ai_host.audio_manager.synthesize_and_stream_speech(incorrect_msg)
-                    except Exception as e:
-                        logger.error(f"Error synthesizing speech: {e}")
+                # TTS blocks until frontend sends audio_complete, so run it in the background
+                # rather than holding this player's socket loop; the buzzer is reactivated
+                # from handle_audio_completed. Skip if the question was already dismissed
+                # (all players wrong) — buzzer_manager.handle_incorrect_answer already did
+                # TTS for "Nobody got it".
+                if self.game_instance.current_question and not test_mode and self.audio_manager:
+                    self._send_in_background(
+                        self._play_incorrect_speech(self.audio_manager, incorrect_msg),
+                        "incorrect answer speech"
+                    )
 
         except Exception as e:
-            logger.error(f"Error processing player answer: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error processing player answer: {e}")
 
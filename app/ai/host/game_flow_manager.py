@@ -7,7 +7,6 @@ import asyncio
 import os
 import random
 import time
-from typing import Optional
 
 logger = logging.getLogger(__name__)
 
@@ -40,8 +39,9 @@ class GameFlowManager:
         self.audio_manager = None
         self.buzzer_manager = None
         self.board_manager = None
-        self.game_instance = None  # Will be set by service.py
+        self.game_instance = None  # Set via set_dependencies
         self.question_manager = None  # Set via set_dependencies
+        self._game_id = None
 
         # Timer for auto-picking a clue when controlling player is idle
         self.clue_selection_timer_start = None
@@ -49,7 +49,7 @@ class GameFlowManager:
     def set_dependencies(self, game_service=None, game_state_manager=None,
                          chat_processor=None, audio_manager=None,
                          buzzer_manager=None, board_manager=None,
-                         question_manager=None):
+                         question_manager=None, game_instance=None):
         """Set dependencies required for game flow management."""
         if game_service:
             self.game_service = game_service
@@ -65,48 +65,57 @@ class GameFlowManager:
             self.board_manager = board_manager
         if question_manager:
             self.question_manager = question_manager
-
-    def _get_game_id(self) -> Optional[str]:
-        """Get the game_id from game_instance if available."""
-        return self.game_instance.game_id if self.game_instance else None
+        if game_instance:
+            self.game_instance = game_instance
+            # A game instance keeps its id for life, so read it once
+            self._game_id = game_instance.game_id
 
     async def monitor_game_state(self):
         """Monitor the game state and respond to changes."""
         try:
+            # Resolve the collaborators once per tick
+            gsm = self.game_state_manager
+            bm = self.buzzer_manager
+            gi = self.game_instance
+
             # Skip if game service is not available yet
             if not self.game_service:
                 # If no game service, make sure timer is cancelled
-                if self.buzzer_manager:
-                    self.buzzer_manager.cancel_timeout()
+                if bm:
+                    bm.cancel_timeout()
                 return
 
             # Handle different game states based on what's currently happening
             
             # Check if we're in the waiting/lobby stage 
-            if not self.game_state_manager.is_game_started():
+            if not gsm.is_game_started():
                 # Cancel any timer if we're in lobby
-                if self.buzzer_manager:
-                    self.buzzer_manager.cancel_timeout()
+                if bm:
+                    bm.cancel_timeout()
                 await self.check_game_start_conditions()
                 return
-                
+
+            # GameState is never replaced, but its current_question changes below, so it
+            # is re-read at each check rather than cached
+            gs = gsm.game_state
+
             # Check if there's a current question
             current_question = None
-            if self.game_instance and self.game_instance.current_question:
-                current_question = self.game_instance.current_question
+            if gi and gi.current_question:
+                current_question = gi.current_question
 
-            if current_question and not self.game_state_manager.game_state.current_question:
+            if current_question and not gs.current_question:
                 # We have a new question to process
                 # Cancel any existing timer when a new question appears
-                if self.buzzer_manager:
-                    self.buzzer_manager.cancel_timeout()
+                if bm:
+                    bm.cancel_timeout()
                 # Reset clue selection timer since a question is now active
                 self.clue_selection_timer_start = None
                 
                 question_data = current_question
                 
                 # Create a question object for our state
-                self.game_state_manager.set_question(
+                gsm.set_question(
                     text=question_data["text"],
                     answer=question_data["answer"],
                     category=question_data["category"],
@@ -116,93 +125,93 @@ class GameFlowManager:
                 logger.debug(f"New question detected: {question_data['text'][:30]}...")
                 
                 # Read the question if it hasn't been read yet
-                if not self.game_state_manager.has_question_been_read(question_data["text"]):
-                    self.game_state_manager.mark_question_read(question_data["text"])
-
+                if gsm.mark_question_read(question_data["text"]):
                     if os.environ.get("TEST_MODE"):
                         # TEST_MODE: skip TTS, activate buzzer directly after short delay
                         logger.info("TEST_MODE: Skipping question audio, activating buzzer directly")
                         await asyncio.sleep(0.5)
-                        await self.buzzer_manager.activate_buzzer(game_id=self._get_game_id())
-                        if self.game_state_manager:
-                            self.game_state_manager.buzzer_active = True
+                        await bm.activate_buzzer(game_id=self._game_id)
+                        if gsm:
+                            gsm.buzzer_active = True
                     else:
                         speech_text = f"For {question_data['category']}, ${question_data['value']}. {question_data['text']}"
                         logger.debug(f"Synthesizing speech: {speech_text}")
                         await self.audio_manager.synthesize_and_stream_speech(speech_text, is_question_audio=True)
                 
             # Check if we need to handle a player's answer - improved to detect new buzzer events
-            current_buzzer = self.game_instance.last_buzzer if self.game_instance else None
-            buzzed_player = self.game_state_manager.get_buzzed_player()
+            current_buzzer = gi.last_buzzer if gi else None
+            buzzed_player = gsm.get_buzzed_player()
             
             # Detect if a new player has buzzed in
             if (current_buzzer and 
-                (not buzzed_player or current_buzzer != self.buzzer_manager.last_buzzer)):
+                (not buzzed_player or current_buzzer != bm.last_buzzer)):
                 
                 player_name = current_buzzer
                 logger.debug(f"Player buzzed in: {player_name}")
                 
                 # Update our tracking
-                self.buzzer_manager.last_buzzer = player_name
+                bm.last_buzzer = player_name
                 
                 # Update our state
-                self.game_state_manager.set_buzzed_player(player_name, set())
+                gsm.set_buzzed_player(player_name, set())
                 
                 # Cancel any active buzzer timeout when someone buzzes in
-                if self.buzzer_manager:
-                    self.buzzer_manager.cancel_timeout()
+                if bm:
+                    bm.cancel_timeout()
             
             # Check if the buzzer state has changed - detect buzzer activation
-            buzzer_active = self.game_instance.buzzer_active if self.game_instance else False
-            if buzzer_active and not self.game_state_manager.buzzer_active:
+            buzzer_active = gi.buzzer_active if gi else False
+            if buzzer_active and not gsm.buzzer_active:
                 logger.debug("Buzzer has been activated")
-                self.game_state_manager.buzzer_active = True
-                asyncio.create_task(self.buzzer_manager.activate_buzzer(game_id=self._get_game_id()))
-            elif not buzzer_active and self.game_state_manager.buzzer_active:
+                gsm.buzzer_active = True
+                asyncio.create_task(bm.activate_buzzer(game_id=self._game_id))
+            elif not buzzer_active and gsm.buzzer_active:
                 logger.debug("Buzzer has been deactivated")
-                self.game_state_manager.buzzer_active = False
-                asyncio.create_task(self.buzzer_manager.deactivate_buzzer(game_id=self._get_game_id()))
+                gsm.buzzer_active = False
+                asyncio.create_task(bm.deactivate_buzzer(game_id=self._game_id))
                 
             # Check if the question has been dismissed
             current_question_check = None
-            if self.game_instance and self.game_instance.current_question:
-                current_question_check = self.game_instance.current_question
+            if gi and gi.current_question:
+                current_question_check = gi.current_question
 
-            if not current_question_check and self.game_state_manager.game_state.current_question:
+            if not current_question_check and gs.current_question:
                 # Question has been dismissed, reset our state
                 logger.debug("Question was dismissed, resetting state")
-                self.game_state_manager.reset_question()
-                self.buzzer_manager.last_buzzer = None
-                asyncio.create_task(self.buzzer_manager.deactivate_buzzer(game_id=self._get_game_id()))
-                self.game_state_manager.buzzer_active = False
+                gsm.reset_question()
+                bm.last_buzzer = None
+                asyncio.create_task(bm.deactivate_buzzer(game_id=self._game_id))
+                gsm.buzzer_active = False
                 
                 # Cancel any buzzer timeout if question was dismissed
-                if self.buzzer_manager:
-                    self.buzzer_manager.cancel_timeout()
+                if bm:
+                    bm.cancel_timeout()
                 
             # Check for clue selection if there's no active question
-            if not self.game_state_manager.game_state.current_question and not current_question_check:
+            if not gs.current_question and not current_question_check:
                 # No question active, make sure timer is cancelled
-                if self.buzzer_manager:
-                    self.buzzer_manager.cancel_timeout()
+                if bm:
+                    bm.cancel_timeout()
                 await self.check_for_clue_selection()
                 
         except Exception as e:
-            logger.error(f"Error monitoring game state: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error monitoring game state: {e}")
     
     async def check_game_start_conditions(self):
         """Check if all conditions are met to start the game."""
         try:
+            gsm = self.game_state_manager
+            gs = gsm.game_state
+            game_started = gsm.is_game_started()
+
             # Log state at the beginning for debugging
-            logger.debug(f"[GameStartCheck] game_started={self.game_state_manager.is_game_started()}, " +
-                       f"welcome_completed={self.game_state_manager.is_welcome_completed()}, " +
-                       f"waiting_for_prefs={self.game_state_manager.is_waiting_for_preferences()}, " +
-                       f"countdown_started={self.game_state_manager.game_state.preference_countdown_started}")
+            logger.debug(f"[GameStartCheck] game_started={game_started}, " +
+                       f"welcome_completed={gsm.is_welcome_completed()}, " +
+                       f"waiting_for_prefs={gsm.is_waiting_for_preferences()}, " +
+                       f"countdown_started={gs.preference_countdown_started}")
             
             # Skip if the game is already started
-            if self.game_state_manager.is_game_started():
+            if game_started:
                 return
             
             # Skip if game service is not available
@@ -221,8 +230,8 @@ class GameFlowManager:
             # Update player names in game state
             for contestant in current_players:
                 player_name = contestant.name
-                if player_name and player_name not in self.game_state_manager.get_player_names():
-                    self.game_state_manager.add_player(player_name)
+                if player_name and player_name not in gsm.get_player_names():
+                    gsm.add_player(player_name)
             
             # Handle restart: skip welcome, load stored preferences, go to board gen
             if self.game_instance and self.game_instance.is_restart:
@@ -232,20 +241,20 @@ class GameFlowManager:
                 # Load stored preferences into the new game_state_manager
                 if self.game_instance.stored_preferences:
                     for name, pref in self.game_instance.stored_preferences.items():
-                        self.game_state_manager.add_player_preference(name, pref)
+                        gsm.add_player_preference(name, pref)
                     self.game_instance.stored_preferences = None
 
                 # Mark welcome/prefs as done so we go straight to board
-                self.game_state_manager.set_welcome_completed(True)
-                self.game_state_manager.set_waiting_for_preferences(False)
+                gsm.set_welcome_completed(True)
+                gsm.set_waiting_for_preferences(False)
                 await self.generate_board_from_preferences()
                 return
 
             # If we have all players but haven't welcomed them yet
-            if (current_player_count >= self.game_state_manager.game_state.expected_player_count and
-                not self.game_state_manager.is_welcome_completed()):
+            if (current_player_count >= gs.expected_player_count and
+                not gsm.is_welcome_completed()):
                 # Lock expected_player_count to actual count so the welcome triggers once
-                self.game_state_manager.game_state.expected_player_count = current_player_count
+                gs.expected_player_count = current_player_count
                 logger.info("All players have joined. Welcoming...")
                 await self.welcome_players()
                 
@@ -254,29 +263,27 @@ class GameFlowManager:
                     await self.game_service.connection_manager.broadcast_message(
                         "com.sc2ctl.bighead.game_ready",
                         {"ready": True},
-                        game_id=self._get_game_id()
+                        game_id=self._game_id
                     )
             
             # Check if we're waiting for preferences and should generate board
-            if self.game_state_manager.is_waiting_for_preferences():
+            if gsm.is_waiting_for_preferences():
                 current_time = time.time()
-                countdown_remaining = 10 - (current_time - self.game_state_manager.game_state.preference_countdown_time) if self.game_state_manager.game_state.preference_countdown_started else 10
-                logger.debug(f"Preference collection state: waiting={self.game_state_manager.is_waiting_for_preferences()}, " +
-                           f"countdown_started={self.game_state_manager.game_state.preference_countdown_started}, " +
+                countdown_remaining = 10 - (current_time - gs.preference_countdown_time) if gs.preference_countdown_started else 10
+                logger.debug(f"Preference collection state: waiting={gsm.is_waiting_for_preferences()}, " +
+                           f"countdown_started={gs.preference_countdown_started}, " +
                            f"countdown_remaining={countdown_remaining:.1f}s")
                 
                 # If countdown is active and time is up, generate board
-                if self.game_state_manager.game_state.preference_countdown_started and countdown_remaining <= 0:
+                if gs.preference_countdown_started and countdown_remaining <= 0:
                     logger.debug("Preference collection time up, generating board from preferences")
                     # Stop gathering preferences before generating board
-                    self.game_state_manager.gathering_preferences = False
-                    logger.debug(f"Stopped gathering preferences. Collected {len(self.game_state_manager.recent_chat_messages)} messages")
+                    gsm.gathering_preferences = False
+                    logger.debug(f"Stopped gathering preferences. Collected {len(gsm.recent_chat_messages)} messages")
                     await self.generate_board_from_preferences()
                 
         except Exception as e:
-            logger.error(f"Error checking game start conditions: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error checking game start conditions: {e}")
             
     async def welcome_players(self):
         """Welcome players to the game and announce the beginning."""
@@ -320,9 +327,7 @@ class GameFlowManager:
             await self.generate_board_from_preferences()
             
         except Exception as e:
-            logger.error(f"Error in welcome players: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error in welcome players: {e}")
             
     async def generate_board_from_preferences(self):
         """Generate a game board based on player preferences from chat."""
@@ -356,7 +361,7 @@ class GameFlowManager:
                 await self.game_service.connection_manager.broadcast_message(
                     "com.sc2ctl.bighead.start_board_generation",
                     {},
-                    game_id=self._get_game_id()
+                    game_id=self._game_id
                 )
                 self.game_state_manager.game_state.board_generation_started = True
             
@@ -394,9 +399,7 @@ class GameFlowManager:
                 await self.assign_first_player()
                 
         except Exception as e:
-            logger.error(f"Error generating board from preferences: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error generating board from preferences: {e}")
             
     async def assign_first_player(self):
         """Assign the first player control of the board and prompt them to select the first clue."""
@@ -425,7 +428,7 @@ class GameFlowManager:
                 await self.game_service.connection_manager.broadcast_message(
                     "com.sc2ctl.bighead.select_question",
                     {"contestant": first_player},
-                    game_id=self._get_game_id()
+                    game_id=self._game_id
                 )
             
             # Announce that the first player has control
@@ -435,9 +438,7 @@ class GameFlowManager:
                 await self.audio_manager.synthesize_and_stream_speech(control_message)
             
         except Exception as e:
-            logger.error(f"Error assigning first player: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error assigning first player: {e}")
             
     async def check_for_clue_selection(self):
         """Check for clue selection messages from the player with control of the board.
@@ -486,9 +487,7 @@ class GameFlowManager:
 
             # Reset timer before displaying (display_question will trigger new question detection)
             self.clue_selection_timer_start = None
-            await self.question_manager.display_question(category_name, value, game_id=self._get_game_id())
+            await self.question_manager.display_question(category_name, value, game_id=self._game_id)
 
         except Exception as e:
-            logger.error(f"Error checking for clue selection: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
\ No newline at end of file
+            logger.exception(f"Error checking for clue selection: {e}")
\ No newline at end of file
@@ -4,7 +4,7 @@ Game state management for the AI host
 
 import logging
 import time
-from typing import List, Dict, Set, Optional, Any
+from typing import AbstractSet, List, Dict, Set, Optional, Any
 from .utils.game_state import GameState
 
 logger = logging.getLogger(__name__)
@@ -90,7 +90,7 @@ class GameStateManager:
         """Get the player with control of the board"""
         return self.game_state.get_player_with_control()
     
-    def set_player_with_control(self, player_name: str, used_questions: Set[str]):
+    def set_player_with_control(self, player_name: str, used_questions: AbstractSet[str]):
         """Set the player with control of the board"""
         self.game_state.set_player_with_control(player_name, used_questions)
     
@@ -133,9 +133,9 @@ class GameStateManager:
         """Check if a question has been read already"""
         return self.game_state.has_question_been_read(question_text)
     
-    def mark_question_read(self, question_text: str):
-        """Mark a question as having been read"""
-        self.game_state.mark_question_read(question_text)
+    def mark_question_read(self, question_text: str) -> bool:
+        """Mark a question as having been read; returns False if it already was"""
+        return self.game_state.mark_question_read(question_text)
     
     def reset_question(self):
         """Reset the current question"""
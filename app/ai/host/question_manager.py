@@ -204,7 +204,7 @@ class QuestionManager:
         await bm.deactivate_buzzer(game_id=game_id)
 
         bm.last_buzzer = None
-        bm.incorrect_players.clear()
+        bm.clear_incorrect_players()
         bm.expecting_reactivation = False
 
         if game.ai_host and game.ai_host.game_state_manager:
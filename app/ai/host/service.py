@@ -121,7 +121,9 @@ class AIHostService:
             game_service=game_service,
             game_state_manager=self.game_state_manager,
             answer_evaluator=self.answer_evaluator,
-            game_instance=self.game_instance if hasattr(self, 'game_instance') else None
+            game_instance=self.game_instance if hasattr(self, 'game_instance') else None,
+            audio_manager=self.audio_manager,
+            buzzer_manager=self.buzzer_manager,
         )
 
         # Set up question manager dependencies
@@ -149,11 +151,11 @@ class AIHostService:
             buzzer_manager=self.buzzer_manager,
             board_manager=self.board_manager,
             question_manager=self.question_manager,
+            game_instance=self.game_instance if hasattr(self, 'game_instance') else None,
         )
 
         # Pass game_instance to components that need it
         if hasattr(self, 'game_instance') and self.game_instance:
-            self.game_flow_manager.game_instance = self.game_instance
             self.board_manager.game_instance = self.game_instance
             self.audio_manager.game_instance = self.game_instance
             self.question_manager.game_instance = self.game_instance
@@ -214,11 +216,7 @@ class AIHostService:
                     
                 except Exception as e:
                     game_error_count += 1
-                    logger.error(f"Error in game loop (attempt {game_error_count}/{max_errors}): {e}")
-                    
-                    # Log traceback for debugging
-                    import traceback
-                    logger.error(traceback.format_exc())
+                    logger.exception(f"Error in game loop (attempt {game_error_count}/{max_errors}): {e}")
                     
                     # Longer backoff on repeated errors
                     await asyncio.sleep(2)
@@ -228,9 +226,7 @@ class AIHostService:
                         game_error_count = 0
                         
         except Exception as e:
-            logger.error(f"Fatal error in game loop: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Fatal error in game loop: {e}")
     
     async def handle_audio_completed(self, audio_id: str):
         """
@@ -2,5 +2,5 @@
 Utility functions for the AI host system
 """
 
-from .helpers import is_same_player, cleanup_audio_files
+from .helpers import is_same_player, cleanup_audio_files, run_in_background
 from .game_state import GameState, Question 
\ No newline at end of file
@@ -4,7 +4,7 @@ Game state tracking for the AI host
 
 import logging
 import time
-from typing import Dict, List, Set, Any, Optional
+from typing import AbstractSet, Dict, List, Set, Any, Optional
 from collections import deque, defaultdict
 from dataclasses import dataclass, field
 
@@ -130,7 +130,7 @@ class GameState:
         """Get the player with control of the board"""
         return self.player_with_control
     
-    def set_player_with_control(self, player_name: str, used_questions: Set[str]):
+    def set_player_with_control(self, player_name: str, used_questions: AbstractSet[str]):
         """Set the player with control of the board"""
         self.player_with_control = player_name
     
@@ -159,9 +159,12 @@ class GameState:
         """Check if a question has been read already"""
         return question_text in self.read_questions
     
-    def mark_question_read(self, question_text: str):
-        """Mark a question as having been read"""
+    def mark_question_read(self, question_text: str) -> bool:
+        """Mark a question as having been read; returns False if it already was"""
+        if question_text in self.read_questions:
+            return False
         self.read_questions.add(question_text)
+        return True
     
     def reset_question(self):
         """Reset the current question"""
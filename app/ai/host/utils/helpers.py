@@ -2,34 +2,72 @@
 Helper functions for the AI host system
 """
 
+import asyncio
+import functools
 import logging
 import os
 import re
+from typing import Set
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=1024)
 def is_same_player(username1: str, username2: str) -> bool:
-    """Check if two usernames refer to the same player (with flexible matching)."""
+    """
+    Check if two usernames refer to the same player (with flexible matching).
+
+    Called for every chat message against the host and buzzed player names, which
+    rarely change, so results are memoized.
+    """
     if not username1 or not username2:
         return False
         
     username1 = username1.lower()
     username2 = username2.lower()
     
-    return (username1 == username2 or
-            username1.startswith(username2) or
-            username2.startswith(username1) or
-            username1 in username2 or
-            username2 in username1)
+    # Containment also covers equality and either name being a prefix of the other
+    return username1 in username2 or username2 in username1
+
+def run_in_background(coro, tasks: Set[asyncio.Task], description: str) -> asyncio.Task:
+    """
+    Start a fire-and-forget task that is kept referenced and has its failure logged.
+
+    The event loop only holds weak references to tasks, so the caller's set keeps
+    the task alive until it finishes; it is removed again on completion.
+    
+    Args:
+        coro: The coroutine to run
+        tasks: The owner's set of in-flight background tasks
+        description: What the task does, for the error log
+        
+    Returns:
+        The started task
+    """
+    task = asyncio.create_task(coro)
+    tasks.add(task)
+
+    def _done(t: asyncio.Task):
+        tasks.discard(t)
+        if not t.cancelled() and t.exception():
+            logger.error(f"Error in background {description}: {t.exception()}")
+
+    task.add_done_callback(_done)
+    return task
 
 async def cleanup_audio_files(directory: str, max_files: int = 5):
     """
     Keep only the most recent audio files, deleting older ones.
     
+    The directory scan and unlinks run in a worker thread so they don't block the event loop.
+    
     Args:
         directory: The directory containing audio files
         max_files: Maximum number of files to keep
     """
+    await asyncio.to_thread(_cleanup_audio_files_sync, directory, max_files)
+
+def _cleanup_audio_files_sync(directory: str, max_files: int):
+    """Blocking implementation of cleanup_audio_files."""
     try:
         # Get list of audio files in the directory
         audio_files = []
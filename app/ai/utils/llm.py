@@ -1,10 +1,12 @@
 import os
 import json
 import asyncio
-from typing import Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 import aiohttp
+import orjson
 import base64
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -23,9 +25,19 @@ class LLMConfig:
 class LLMClient:
     """Client for making LLM API calls"""
 
-    def __init__(self, config: Optional[LLMConfig] = None):
-        """Initialize LLM client with optional config"""
+    def __init__(self, config: Optional[LLMConfig] = None, session: Optional[aiohttp.ClientSession] = None):
+        """
+        Initialize LLM client with optional config
+
+        Args:
+            config: Default config for calls made by this client
+            session: Optional shared aiohttp session; when unset a session is opened per call
+        """
         self.config = config or LLMConfig()
+        self.session = session
+        # LRU of template responses for callers that opt in via use_cache
+        self.response_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        self.response_cache_size = 256
         # Get API key from environment variable
         self.api_key = os.environ.get("INWORLD_API_KEY")
         if not self.api_key:
@@ -90,8 +102,12 @@ class LLMClient:
 
                 logger.debug(f"Sending request to Inworld API with payload: {payload}")
 
-                # Make the API request
-                async with aiohttp.ClientSession() as session:
+                # Make the API request, reusing the shared session when one is set
+                session = self.session
+                owns_session = session is None
+                if owns_session:
+                    session = aiohttp.ClientSession()
+                try:
                     headers = {
                         "Authorization": f"Basic {self.api_key}",
                         "Content-Type": "application/json"
@@ -109,7 +125,7 @@ class LLMClient:
                             logger.error(f"Inworld API error response: {error_text}")
                             raise Exception(f"Inworld API error: {error_text}")
 
-                        result = await response.json()
+                        result = orjson.loads(await response.read())
                         logger.debug(f"Raw Inworld API response: {result}")
 
                         # Extract response text from the nested structure
@@ -118,10 +134,13 @@ class LLMClient:
 
                         # If JSON format was requested, validate the response
                         if cfg.response_format:
-                            json.loads(response_text)
+                            orjson.loads(response_text)
                             logger.debug("Successfully validated response as JSON")
 
                         return response_text
+                finally:
+                    if owns_session:
+                        await session.close()
 
             except (json.JSONDecodeError, aiohttp.ClientError, asyncio.TimeoutError) as e:
                 last_exception = e
@@ -167,7 +186,10 @@ class LLMClient:
         user_context: Dict[str, any],
         system_template: Optional[str] = None,
         system_context: Optional[Dict[str, any]] = None,
-        config: Optional[LLMConfig] = None
+        config: Optional[LLMConfig] = None,
+        use_cache: bool = False,
+        refresh_cache: bool = False,
+        validate: Optional[Callable[[str], Any]] = None
     ) -> str:
         """
         Make a chat completion using Jinja2 templates
@@ -178,10 +200,29 @@ class LLMClient:
             system_template: Optional name of the system prompt template file
             system_context: Optional context variables for the system template
             config: Optional config override
+            use_cache: Reuse a previous response for identical templates, context and config
+            refresh_cache: With use_cache, skip the lookup and overwrite the cached response
+            validate: With use_cache, called on a fresh response before it is cached; if it
+                raises, nothing is cached and the exception propagates
             
         Returns:
             Generated response text
         """
+        cache_key = None
+        if use_cache:
+            cache_key = (
+                system_template,
+                user_template,
+                json.dumps(system_context or {}, sort_keys=True, default=str),
+                json.dumps(user_context, sort_keys=True, default=str),
+                repr(config or self.config),
+            )
+            cached = None if refresh_cache else self.response_cache.get(cache_key)
+            if cached is not None:
+                self.response_cache.move_to_end(cache_key)
+                logger.debug(f"Using cached LLM response for template {user_template}")
+                return cached
+        
         messages = []
         
         # Add system message if template is provided
@@ -199,4 +240,13 @@ class LLMClient:
         )
         messages.append({"role": "user", "content": user_prompt})
         
-        return await self.chat_completion(messages, config)
+        response_text = await self.chat_completion(messages, config)
+        
+        if cache_key is not None:
+            if validate is not None:
+                validate(response_text)
+            self.response_cache[cache_key] = response_text
+            if len(self.response_cache) > self.response_cache_size:
+                self.response_cache.popitem(last=False)
+        
+        return response_text
@@ -31,14 +31,27 @@ class PromptManager:
         self.templates_dir = templates_dir
         logger.info(f"Initializing PromptManager with templates directory: {templates_dir}")
         
-        # Initialize Jinja2 environment
+        # Initialize Jinja2 environment. Compiled templates are cached for the
+        # lifetime of the manager without re-checking the files on every render.
         self.env = Environment(
             loader=FileSystemLoader(templates_dir),
             autoescape=select_autoescape(['html', 'xml']),
             trim_blocks=True,
-            lstrip_blocks=True
+            lstrip_blocks=True,
+            cache_size=-1,
+            auto_reload=False
         )
     
+    def precompile(self, *template_names: str):
+        """
+        Load and compile templates ahead of their first render.
+        
+        Args:
+            *template_names: Names of the template files (with .j2 extension)
+        """
+        for template_name in template_names:
+            self.env.get_template(template_name)
+    
     def render_template(self, template_name: str, **kwargs) -> str:
         """
         Render a template with the given context.
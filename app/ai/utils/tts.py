@@ -9,12 +9,28 @@ import base64
 import os
 import logging
 import re
+import uuid
 from pathlib import Path
 
 import aiohttp
 
 logger = logging.getLogger(__name__)
 
+
+def _write_atomic(output_file, data):
+    """Write data to a temp file beside output_file, then replace output_file with it."""
+    tmp_file = f"{output_file}.{uuid.uuid4().hex[:8]}.tmp"
+    try:
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+        raise
+
 class TTSClient:
     """
     Client for Inworld's text-to-speech service.
@@ -28,6 +44,12 @@ class TTSClient:
         "cale": "/keɪl/",
         "pasta": "/ˈpæstə/"
     }
+    # (version, compiled alternation over PHONEME_SUBSTITUTIONS, lowercase lookup), rebuilt
+    # lazily after the substitutions change. Published as one tuple because speech is
+    # generated in worker threads, which must never see a regex paired with a stale lookup;
+    # the version keeps a build that raced an add/remove from outliving it.
+    _phoneme_matcher = None
+    _phoneme_version = 0
     
     def __init__(self, api_key=None):
         """
@@ -78,12 +100,26 @@ class TTSClient:
         Returns:
             str: Text with phoneme substitutions applied.
         """
-        processed_text = text
-        
-        for word, phoneme in self.PHONEME_SUBSTITUTIONS.items():
+        cls = type(self)
+        matcher = cls._phoneme_matcher
+        if matcher is None or matcher[0] != cls._phoneme_version:
+            version = cls._phoneme_version
+            # Snapshot so a concurrent add/remove can't change the dict mid-build
+            substitutions = dict(self.PHONEME_SUBSTITUTIONS)
+            if not substitutions:
+                return text
+            # Longest words first so a word is never shadowed by one of its prefixes
+            words = sorted(substitutions, key=len, reverse=True)
             # Use word boundaries to match whole words only (case-insensitive)
-            pattern = r'\b' + re.escape(word) + r'\b'
-            processed_text = re.sub(pattern, phoneme, processed_text, flags=re.IGNORECASE)
+            regex = re.compile(
+                r'\b(?:' + '|'.join(re.escape(word) for word in words) + r')\b', re.IGNORECASE
+            )
+            lookup = {word.lower(): phoneme for word, phoneme in substitutions.items()}
+            matcher = (version, regex, lookup)
+            cls._phoneme_matcher = matcher
+
+        _, regex, lookup = matcher
+        processed_text = regex.sub(lambda m: lookup[m.group(0).lower()], text)
         
         if processed_text != text:
             logger.debug(f"Applied phoneme substitutions. Original: '{text}' -> Processed: '{processed_text}'")
@@ -92,7 +128,8 @@ class TTSClient:
     
     def generate_speech(self, text, voice_id="Dennis", output_file=None, model_id="inworld-tts-1-max", 
                        audio_encoding="LINEAR16", temperature=1.1, timestamp_type=None, 
-                       sample_rate_hertz=22050, speaking_rate=1.0, pitch=0.0, voice_name=None):
+                       sample_rate_hertz=22050, speaking_rate=1.0, pitch=0.0, voice_name=None,
+                       save_raw_on_error=True):
         """
         Generate speech from text and save it to an audio file.
         
@@ -112,6 +149,9 @@ class TTSClient:
             speaking_rate (float, optional): Speaking speed (0.5-1.5). Defaults to 1.0.
             pitch (float, optional): Pitch modification (-5.0 to 5.0). Defaults to 0.0.
             voice_name (str, optional): DEPRECATED. Use voice_id instead. Maintained for backward compatibility.
+            save_raw_on_error (bool, optional): Save the raw response body to output_file when it
+                                                cannot be decoded. Pass False when output_file is
+                                                reused as a cache, so a bad response raises instead.
         
         Returns:
             str: The path to the generated audio file.
@@ -190,9 +230,8 @@ class TTSClient:
                     # Decode the base64 audio data
                     audio_data = base64.b64decode(audio_base64)
                     
-                    # Write to file
-                    with open(output_file, 'wb') as f:
-                        f.write(audio_data)
+                    # Write to a temp file first so readers never see a partial file
+                    _write_atomic(output_file, audio_data)
                     
                     logger.debug(f"Successfully saved audio to: {output_file}")
                     
@@ -213,16 +252,18 @@ class TTSClient:
                     
             except json.JSONDecodeError as e:
                 logger.error(f"Failed to parse JSON response: {e}")
+                if not save_raw_on_error:
+                    raise
                 # Save raw response as fallback
-                with open(output_file, 'wb') as f:
-                    f.write(response.content)
+                _write_atomic(output_file, response.content)
                 logger.debug(f"Saved raw response after JSON parse error: {output_file}")
                 return output_file
             except Exception as e:
                 logger.error(f"Error processing response: {e}")
+                if not save_raw_on_error:
+                    raise
                 # Save raw response as fallback
-                with open(output_file, 'wb') as f:
-                    f.write(response.content)
+                _write_atomic(output_file, response.content)
                 logger.debug(f"Saved raw response after processing error: {output_file}")
                 return output_file
             
@@ -230,9 +271,7 @@ class TTSClient:
             logger.error(f"HTTP request error: {str(e)}")
             raise Exception(f"Failed to make API request: {str(e)}")
         except Exception as e:
-            logger.error(f"Error generating speech: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error generating speech: {str(e)}")
             raise Exception(f"Failed to generate speech: {str(e)}")
     
     async def _get_session(self):
@@ -328,6 +367,7 @@ class TTSClient:
             phoneme (str): The IPA phoneme representation.
         """
         self.PHONEME_SUBSTITUTIONS[word] = phoneme
+        type(self)._phoneme_version += 1
         logger.debug(f"Added phoneme substitution: '{word}' -> '{phoneme}'")
     
     def remove_phoneme_substitution(self, word):
@@ -339,6 +379,7 @@ class TTSClient:
         """
         if word in self.PHONEME_SUBSTITUTIONS:
             del self.PHONEME_SUBSTITUTIONS[word]
+            type(self)._phoneme_version += 1
             logger.debug(f"Removed phoneme substitution for: '{word}'")
         else:
             logger.warning(f"Word '{word}' not found in phoneme substitutions")
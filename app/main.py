@@ -26,6 +26,7 @@ from .websockets.handlers import router as ws_router, init_handlers
 from .services.game_service import GameService
 from .services.game_manager import GameManager
 from .services.chat_manager import ChatManager
+from .ai.host.board_manager import BoardManager
 
 # Try to import routers
 try:
@@ -301,6 +302,7 @@ async def startup_event():
 async def shutdown_event():
     logger.info("Shutting down application...")
     await game_manager.stop()
+    await BoardManager.close_shared_llm_client()
     logger.info("Application shutdown completed")
 
 # Mount frontend static assets AFTER all API and WebSocket routes are defined
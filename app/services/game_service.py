@@ -1,12 +1,11 @@
 from fastapi import WebSocket
 import asyncio
-import time
 from ..websockets.connection_manager import ConnectionManager
 import logging
 from ..ai.host.buzzer_manager import BuzzerManager
-import json
+import orjson
 from pathlib import Path
-import re
+import uuid
 
 logger = logging.getLogger(__name__)
 
@@ -69,10 +68,10 @@ class GameService:
                 raise FileNotFoundError(f"Board {board_id} not found")
 
             logger.info(f"Loading board from {board_path}")
-            with open(board_path, 'r') as f:
-                board_data = json.load(f)
-                game.board = board_data
-                logger.info(f"Successfully loaded board: {board_id}")
+            # Read off the event loop so other games keep running while the board loads
+            board_data = orjson.loads(await asyncio.to_thread(board_path.read_bytes))
+            game.board = board_data
+            logger.info(f"Successfully loaded board: {board_id}")
 
             # Send the board to appropriate clients
             await self.connection_manager.broadcast_message(
@@ -457,16 +456,10 @@ class GameService:
             audio_id: Optional unique ID for this audio playback
             game_id: Optional game ID to scope broadcast to specific game
         """
-        # If no audio_id provided, try to extract it from the filename
+        # Audio files are content-addressed and replayed, so the filename can't identify
+        # a playback; generate a fresh ID when the caller didn't supply one
         if not audio_id:
-            # Try to extract timestamp from filename (e.g., question_audio_1234567890.wav)
-            match = re.search(r'question_audio_(\d+)', audio_url)
-            if match:
-                # Use the timestamp from the filename
-                audio_id = f"audio_{match.group(1)}"
-            else:
-                # Fallback to generating a new ID
-                audio_id = f"audio_{int(time.time() * 1000)}"
+            audio_id = f"audio_{uuid.uuid4().hex}"
 
         logger.debug(f"Broadcasting audio playback: {audio_url} (ID: {audio_id})")
 
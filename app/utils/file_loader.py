@@ -1,7 +1,9 @@
-import json
 import os
 import logging
 from typing import Dict, Any, List, Optional
+
+import orjson
+
 from ..models.board import Board
 from ..models.category import Category
 from ..models.contestant import Contestant
@@ -32,8 +34,8 @@ class BoardFactory:
         for path in [spec_path, app_path]:
             if os.path.exists(path):
                 logger.info(f"Found game data at: {path}")
-                with open(path, 'r') as f:
-                    data = json.load(f)
+                with open(path, 'rb') as f:
+                    data = orjson.loads(f.read())
                 
                 # Check if the data has all required sections
                 if self._validate_data(data, path):
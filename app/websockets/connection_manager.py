@@ -1,6 +1,8 @@
+import asyncio
 import logging
-from typing import Dict, Set, Optional
+from typing import Dict, List, Set, Optional, Tuple
 from fastapi import WebSocket
+import orjson
 import uuid
 
 logger = logging.getLogger(__name__)
@@ -154,24 +156,63 @@ class ConnectionManager:
             topic: The message topic
             payload: The message payload
         """
+        await self._broadcast_frames(game_id, [{"topic": topic, "payload": payload}])
+
+    async def broadcast_batch(self, game_id: str, messages: List[Tuple[str, dict]]):
+        """
+        Broadcast several messages to all clients in a game room in one pass.
+
+        Each client receives the messages back-to-back and in order, instead of the
+        room being walked once per message.
+
+        Args:
+            game_id: The game ID to broadcast to
+            messages: (topic, payload) pairs to send
+        """
+        await self._broadcast_frames(
+            game_id, [{"topic": topic, "payload": payload} for topic, payload in messages]
+        )
+
+    async def _broadcast_frames(self, game_id: str, frames: List[dict]):
+        """
+        Send frames to every client in a room, to all clients concurrently.
+
+        A slow or stalled socket no longer holds up delivery to the rest of the room;
+        each client still receives the frames in order. Frames are serialized once with
+        orjson rather than by send_json once per client.
+
+        Args:
+            game_id: The game ID to broadcast to
+            frames: The messages to send
+        """
         if game_id not in self.rooms:
             logger.warning(f"No room found for game {game_id}")
             return
 
-        message = {"topic": topic, "payload": payload}
-        disconnected = []
+        try:
+            texts = [orjson.dumps(frame, option=orjson.OPT_NON_STR_KEYS).decode() for frame in frames]
+        except TypeError as e:
+            logger.error(f"Cannot serialize broadcast for game {game_id}: {e}")
+            return
+
+        async def send_to(client_id: str, websocket: WebSocket) -> Optional[str]:
+            try:
+                for text in texts:
+                    await websocket.send_text(text)
+            except Exception as e:
+                logger.error(f"Error broadcasting to {client_id}: {e}")
+                return client_id
+            return None
 
-        for client_id in self.rooms[game_id].copy():
-            if client_id in self.active_connections:
-                try:
-                    await self.active_connections[client_id].send_json(message)
-                except Exception as e:
-                    logger.error(f"Error broadcasting to {client_id}: {e}")
-                    disconnected.append(client_id)
+        results = await asyncio.gather(*(
+            send_to(client_id, self.active_connections[client_id])
+            for client_id in self.rooms[game_id].copy()
+            if client_id in self.active_connections
+        ))
 
         # Clean up disconnected clients
-        for client_id in disconnected:
-            if client_id in self.active_connections:
+        for client_id in results:
+            if client_id and client_id in self.active_connections:
                 websocket = self.active_connections[client_id]
                 await self.disconnect(websocket)
 
@@ -640,16 +640,8 @@ export function GameProvider({ children }) {
           
           console.log('Playing audio with full URL:', audioUrl);
           
-          // Extract audio ID from the payload or the filename
-          let audioId = message.payload.audio_id;
-          if (!audioId) {
-            const filenameMatch = rawUrl.match(/question_audio_(\d+)/);
-            if (filenameMatch && filenameMatch[1]) {
-              audioId = `audio_${filenameMatch[1]}`;
-            } else {
-              audioId = `audio_${Date.now()}`;
-            }
-          }
+          // The backend always sends an audio ID; filenames are content hashes, not IDs
+          const audioId = message.payload.audio_id || `audio_${Date.now()}`;
           console.log('Using audio ID:', audioId);
           
           // Use the pre-warmed Audio element if available (iOS needs this)
@@ -697,6 +689,16 @@ export function GameProvider({ children }) {
           payload: message.payload
         });
         break;
+      case 'com.sc2ctl.bighead.reveal_categories_batch':
+        console.log('Revealing categories:', message.payload.categories);
+        // The whole board arrives at once; reveal_at_ms staggers the animation
+        message.payload.categories.forEach(({ index, category, reveal_at_ms }) => {
+          setTimeout(() => dispatch({
+            type: 'REVEAL_CATEGORY',
+            payload: { index, category }
+          }), reveal_at_ms || 0);
+        });
+        break;
       case 'com.sc2ctl.bighead.audio_complete':
         console.log('Audio playback complete:', message.payload.audio_id);
         // Do not try to set buzzer status here - the server will send a separate buzzer_status message